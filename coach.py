@@ -1,15 +1,23 @@
 #!/usr/bin/env python3
 import argparse
 import datetime as dt
+import functools
 import hashlib
+import math
+import operator
 import os
 import re
+import sqlite3
 import sys
+import threading
 import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 try:
     from anthropic import Anthropic
@@ -21,9 +29,21 @@ try:
 except Exception:  # pragma: no cover
     tweepy = None  # type: ignore
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
 import json
 from dataclasses import dataclass
 
+# The spark_coach package lives in src/; make it importable for `python coach.py` runs
+_SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from spark_coach.storage import atomic_write  # noqa: E402
+
 # ---- Config helpers ----
 
 TZ = dt.timezone(dt.timedelta(hours=1))  # CET (simplified; ignores DST)
@@ -32,7 +52,9 @@ ROBOT_REACTION = "robot_face"
 THUMBS_UP = "+1"
 
 
+@functools.cache
 def env_required(name: str) -> str:
+    """Required env var; values are process-constant, so each name is read once."""
     val = os.getenv(name)
     if not val:
         raise RuntimeError(f"Missing required env: {name}")
@@ -79,13 +101,118 @@ def _choose_model(task: str) -> list[str]:
     ]
 
 
-def _anthropic_complete(prompt: str, task: str) -> str:
+# Models that 404'd (retired / not enabled for the account) are skipped for a while
+_MODEL_BLACKLIST_TTL_SEC = 6 * 3600
+
+
+def _model_blacklist_path() -> str:
+    return os.path.join(_ensure_data_dir(), "model_blacklist.json")
+
+
+def _load_model_blacklist() -> dict[str, float]:
+    """Return {model: expires_at} for models still blacklisted."""
+    try:
+        with open(_model_blacklist_path(), encoding="utf-8") as f:
+            raw = json.load(f)
+    except Exception:
+        return {}
+    now = time.time()
+    return {m: float(exp) for m, exp in raw.items() if float(exp) > now}
+
+
+def _blacklist_model(model: str) -> None:
+    bl = _load_model_blacklist()
+    bl[model] = time.time() + _MODEL_BLACKLIST_TTL_SEC
+    atomic_write(_model_blacklist_path(), json.dumps(bl).encode())
+
+
+def _is_model_unavailable(err: Exception) -> bool:
+    status = getattr(err, "status_code", None)
+    return status == 404 or (status == 400 and "model" in str(err).lower())
+
+
+def _candidate_models(task: str) -> list[str]:
+    models = _choose_model(task)
+    blacklist = _load_model_blacklist()
+    # Never filter down to nothing; retry the full list if everything is blacklisted
+    return [m for m in models if m not in blacklist] or models
+
+
+@functools.lru_cache(maxsize=1)
+def _anthropic_client() -> "Anthropic":
     api_key = env_required("ANTHROPIC_API_KEY")
     if Anthropic is None:
         raise RuntimeError("anthropic package is not installed")
-    client = Anthropic(api_key=api_key)
+    # The SDK retries 408/409/429/5xx and connection errors with exponential backoff
+    return Anthropic(api_key=api_key, max_retries=3)
+
+
+def _system_blocks(system: str) -> list[dict]:
+    """System prompt as a cacheable block: repeat calls reuse the server-side prefix cache."""
+    return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+
+# Completions are cached on disk so cron re-runs and retries don't pay for identical prompts.
+# "suggest" only covers a quick retry: the afternoon session (or a same-day rerun) often builds
+# the morning's exact prompt and must get fresh tweets, not options that may already be posted.
+_LLM_CACHE_TTL_SEC = {"suggest": 5 * 60, "replies": 30 * 60}
+_LLM_CACHE_DEFAULT_TTL_SEC = 3600
+
+
+def _llm_cache_path() -> str:
+    return os.path.join(_ensure_data_dir(), "llm_cache.sqlite")
+
+
+def _llm_cache_key(model: str, system: str | None, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\0{system or ''}\0{prompt}".encode()).hexdigest()
+
+
+def _llm_cache_connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(_llm_cache_path(), timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, text TEXT NOT NULL, ts REAL NOT NULL)"
+    )
+    return conn
 
-    candidate_models = _choose_model(task)
+
+def _llm_cache_get(key: str, task: str) -> str | None:
+    ttl = _LLM_CACHE_TTL_SEC.get(task, _LLM_CACHE_DEFAULT_TTL_SEC)
+    try:
+        with closing(_llm_cache_connect()) as conn:
+            row = conn.execute(
+                "SELECT text FROM llm_cache WHERE key = ? AND ts > ?", (key, time.time() - ttl)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def _llm_cache_put(key: str, text: str) -> None:
+    try:
+        with closing(_llm_cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, text, ts) VALUES (?, ?, ?)",
+                (key, text, time.time()),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _anthropic_complete(prompt: str, task: str, *, system: str | None = None) -> str:
+    """Complete `prompt`; a stable instruction block should go in `system` (prompt-cached).
+
+    Responses are reused from the local cache for a per-task TTL unless LLM_CACHE=0.
+    """
+    candidate_models = _candidate_models(task)
+    use_cache = os.getenv("LLM_CACHE", "1") != "0"
+    cache_key = _llm_cache_key(candidate_models[0], system, prompt)
+    if use_cache:
+        cached = _llm_cache_get(cache_key, task)
+        if cached is not None:
+            return cached
+
+    client = _anthropic_client()
+    extra: dict[str, object] = {"system": _system_blocks(system)} if system else {}
     last_err: Exception | None = None
     msg = None
     for model in candidate_models:
@@ -94,48 +221,180 @@ def _anthropic_complete(prompt: str, task: str) -> str:
                 model=model,
                 max_tokens=600,
                 messages=[{"role": "user", "content": prompt}],
+                **extra,
             )
             break
         except Exception as e:
+            # Only a missing/retired model moves on to the next candidate; transient errors
+            # were already retried on the same model by the client, so surface them as-is
+            if not _is_model_unavailable(e):
+                raise
+            _blacklist_model(model)
             last_err = e
-            continue
     if msg is None and last_err is not None:
         raise last_err
 
+    text = _message_text(msg)
+    if use_cache and text:
+        _llm_cache_put(cache_key, text)
+    return text
+
+
+def _message_text(msg: object) -> str:
     content_parts: list[str] = []
-    for part in msg.content:  # type: ignore[union-attr]
+    for part in msg.content:  # type: ignore[attr-defined]
         text = getattr(part, "text", None) or getattr(part, "content", None)
         if isinstance(text, str):
             content_parts.append(text)
     return "\n".join(content_parts).strip()
 
 
+# After a cancel, wait this long for the batch to end so already-finished results are kept
+_BATCH_CANCEL_GRACE_SEC = 15.0
+
+
+def _cancel_batch(client: "Anthropic", batch_id: str) -> object:
+    """Cancel a batch and wait briefly for it to reach "ended"; returns the last batch state."""
+    batch = client.messages.batches.cancel(batch_id)
+    grace_end = time.time() + _BATCH_CANCEL_GRACE_SEC
+    while batch.processing_status != "ended" and time.time() < grace_end:
+        time.sleep(1.0)
+        batch = client.messages.batches.retrieve(batch_id)
+    return batch
+
+
+def _anthropic_batch_complete(
+    prompts: dict[str, str],
+    task: str,
+    timeout_sec: int = 1800,
+    *,
+    system: str | None = None,
+    max_poll_sec: float = 60.0,
+) -> dict[str, str]:
+    """Run several prompts through the Message Batches API (50% cheaper); returns text by id.
+
+    If the batch has not ended within `timeout_sec` it is cancelled; requests that already
+    succeeded (and are billed) are still returned, and callers fall back to live calls for
+    the missing ids.
+    """
+    client = _anthropic_client()
+    extra: dict[str, object] = {"system": _system_blocks(system)} if system else {}
+
+    model = _candidate_models(task)[0]
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": model,
+                    "max_tokens": 600,
+                    "messages": [{"role": "user", "content": prompt}],
+                    **extra,
+                },
+            }
+            for custom_id, prompt in prompts.items()
+        ]
+    )
+    # Poll with exponential backoff (up to max_poll_sec) until the batch has ended; a sleep
+    # never runs past the deadline
+    delay = min(5.0, max_poll_sec)
+    deadline = time.time() + timeout_sec
+    while batch.processing_status != "ended":
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            batch = _cancel_batch(client, batch.id)
+            if batch.processing_status != "ended":
+                return {}
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_poll_sec)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    out: dict[str, str] = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            out[entry.custom_id] = _message_text(entry.result.message)
+    return out
+
+
 def _voice_profile_path() -> str:
     return os.path.join(_ensure_data_dir(), "voice_profile.json")
 
 
 def _load_voice_profile() -> dict:
     try:
-        with open(_voice_profile_path(), encoding="utf-8") as f:
-            prof = json.load(f)
-            if not prof.get("product"):
-                raise ValueError("incomplete profile")
-            return prof
+        with open(_voice_profile_path(), "rb") as f:
+            raw = f.read()
+        prof = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if not prof.get("product"):
+            raise ValueError("incomplete profile")
+        return prof
     except Exception:
         return {}
 
 
 def _save_voice_profile(p: dict) -> None:
     p.setdefault("updated_at", dt.datetime.now(dt.timezone.utc).date().isoformat())
-    with open(_voice_profile_path(), "w", encoding="utf-8") as f:
-        json.dump(p, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(p, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(p, ensure_ascii=False, indent=2).encode()
+    atomic_write(_voice_profile_path(), data)
+
+
+def _daily_batch_path() -> str:
+    return os.path.join(_ensure_data_dir(), "daily_batch.json")
+
+
+def _prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _take_daily_batch_result(custom_id: str, prompt: str) -> str | None:
+    """Pop today's prefetched batch result for `custom_id` if it was built from `prompt`."""
+    today = dt.datetime.now(dt.timezone.utc).date().isoformat()
+    try:
+        with open(_daily_batch_path(), encoding="utf-8") as f:
+            state = json.load(f)
+    except Exception:
+        return None
+    if state.get("date") != today:
+        return None
+    if state.get("prompt_hashes", {}).get(custom_id) != _prompt_hash(prompt):
+        return None
+    text = state.get("results", {}).pop(custom_id, None)
+    if text is None:
+        return None
+    atomic_write(_daily_batch_path(), json.dumps(state, ensure_ascii=False).encode())
+    return text
 
 
 def generate_suggestions() -> str:
-    """Generate tweets using calibrated voice profile; error if profile missing."""
+    """Generate tweets using calibrated voice profile; "" if the model returned nothing.
+
+    Raises RuntimeError if the voice profile is missing, so no error text ends up as an option.
+    """
     prof = _load_voice_profile()
     if not prof:
-        return "- ERROR: Voice profile missing. Run: python coach.py --task setup"
+        raise RuntimeError("Voice profile missing. Run: python coach.py --task setup")
+    system, prompt = _build_suggestions_prompt(prof)
+    # Prefer the suggestions prefetched by the daily batch run (first call of the day only)
+    prefetched = _take_daily_batch_result("suggest", system + "\0" + prompt)
+    if prefetched:
+        return prefetched
+    return _anthropic_complete(prompt, task="suggest", system=system)
+
+
+# Fixed task instructions; kept byte-identical so the cached system prefix stays valid
+_SUGGEST_INSTRUCTIONS = (
+    "Generate 3 tweet options about their CURRENT WORK.\n"
+    "Use their voice. Reference their actual product updates.\nBe specific with numbers/data when available.\n"
+    "Output EXACTLY two sections with bullets only:\nTweets:\n- three options\nReply Opportunities:\n- three targets (handle + one line why)."
+)
+
+
+def _build_suggestions_prompt(prof: dict) -> tuple[str, str]:
+    """Return (system, user) prompts; the profile-derived system part is stable across runs."""
     name = prof.get("name", "")
     handle = prof.get("handle", "")
     product = prof.get("product", "")
@@ -149,51 +408,175 @@ def generate_suggestions() -> str:
     banned = ", ".join(prof.get("banned_words", [])) or "(none)"
     weekly_ctx = prof.get("weekly_context") or recent_work
 
-    prompt = (
+    system = (
         f"You are writing tweets for {name} (@{handle}).\n\n"
-        f"CONTEXT:\nProduct: {product}\nRecent work: {recent_work}\nKey insight: {contrarian}\n\n"
         f"VOICE STYLE:\n{style}\n\n"
         f"EXAMPLES TO LEARN FROM:\n{examples}\n\n"
         f"NEVER WRITE ABOUT:\n{blocklist}\n\n"
-        f"NEVER USE THESE WORDS:\n{banned}\n\n"
-        f"CURRENT WEEK CONTEXT:\n{weekly_ctx}\n\n"
-        "Generate 3 tweet options about their CURRENT WORK.\n"
-        "Use their voice. Reference their actual product updates.\nBe specific with numbers/data when available.\n"
-        "Output EXACTLY two sections with bullets only:\nTweets:\n- three options\nReply Opportunities:\n- three targets (handle + one line why)."
+        f"NEVER USE THESE WORDS:\n{banned}\n\n" + _SUGGEST_INSTRUCTIONS
+    )
+    user = (
+        f"CONTEXT:\nProduct: {product}\nRecent work: {recent_work}\nKey insight: {contrarian}\n\n"
+        f"CURRENT WEEK CONTEXT:\n{weekly_ctx}"
     )
-    return _anthropic_complete(prompt, task="suggest") or "- (no suggestions returned)"
+    return system, user
+
+
+# The 07:00 UTC prefetch must finish well before the 07:30 morning session, and a cron run
+# should not hold a CI runner for long waiting on it
+_DAILY_BATCH_TIMEOUT_SEC = 20 * 60
+
+
+def run_daily_batch() -> None:
+    """Prefetch the day-constant LLM prompts in a single Message Batches request.
+
+    Only the suggestion prompt is LLM-backed today (summary/weekly are pure metrics), so the
+    batch holds that prompt; results are stored in data/daily_batch.json and consumed by the
+    morning session via generate_suggestions(). Only service.py schedules it: the file has to
+    survive until 07:30, which the per-job runners of the Actions workflow don't allow.
+    """
+    prof = _load_voice_profile()
+    if not prof:
+        print("No voice profile; nothing to batch")
+        return
+    system, prompt = _build_suggestions_prompt(prof)
+    prompts = {"suggest": prompt}
+    now = dt.datetime.now(dt.timezone.utc)
+    timeout = _DAILY_BATCH_TIMEOUT_SEC
+    # Before the morning session, give up a few minutes ahead of it: a batch still running at
+    # 07:30 would be paid for on top of the session's live call
+    ready_by = now.replace(hour=7, minute=25, second=0, microsecond=0)
+    if now < ready_by + dt.timedelta(minutes=5):
+        timeout = min(timeout, int((ready_by - now).total_seconds()))
+        if timeout < 60:
+            print("Too close to the morning session; it will generate suggestions live")
+            return
+    results = _anthropic_batch_complete(prompts, task="suggest", timeout_sec=timeout, system=system)
+    state = {
+        "date": dt.datetime.now(dt.timezone.utc).date().isoformat(),
+        "prompt_hashes": {k: _prompt_hash(system + "\0" + v) for k, v in prompts.items()},
+        "results": results,
+    }
+    atomic_write(_daily_batch_path(), json.dumps(state, ensure_ascii=False).encode())
+    _log_event({"type": "batch", "task": "daily", "custom_ids": sorted(results)})
+    print(f"Daily batch complete: {', '.join(sorted(results)) or 'no results'}")
 
 
 # ---- Slack helpers ----
 
 
-def slack_client() -> WebClient:
-    return WebClient(token=env_required("SLACK_BOT_TOKEN"))
+class _RateLimiter:
+    """Thread-safe token bucket: at most `rate` acquisitions per `per` seconds."""
+
+    def __init__(self, rate: int, per: float) -> None:
+        self._rate = rate
+        self._per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take the next slot; returns its time.monotonic() start (FIFO by call order)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._rate, self._tokens + (now - self._updated) * self._rate / self._per
+            )
+            self._updated = now
+            self._tokens -= 1
+            return now + max(0.0, -self._tokens * self._per / self._rate)
 
+    def acquire(self, slot: float | None = None) -> None:
+        """Block until `slot` (from reserve()), reserving one now if not given."""
+        if slot is None:
+            slot = self.reserve()
+        time.sleep(max(0.0, slot - time.monotonic()))
 
-def slack_post(channel: str, text: str, *, thread_ts: str | None = None) -> tuple[str, str]:
-    """Post a message; returns (channel, ts)."""
+
+# Slack allows ~1 message/s per channel and ~50 req/min on Tier 2/3 read & reaction methods
+_POST_LIMITERS: dict[str, _RateLimiter] = {}
+_POST_LIMITERS_LOCK = threading.Lock()
+_READ_LIMITER = _RateLimiter(50, 60.0)
+
+
+def _post_limiter(channel: str) -> _RateLimiter:
+    with _POST_LIMITERS_LOCK:
+        limiter = _POST_LIMITERS.get(channel)
+        if limiter is None:
+            limiter = _POST_LIMITERS[channel] = _RateLimiter(1, 1.1)
+        return limiter
+
+
+@functools.lru_cache(maxsize=1)
+def slack_client() -> WebClient:
+    """Process-wide WebClient so all Slack calls share one keep-alive connection pool."""
+    client = WebClient(token=env_required("SLACK_BOT_TOKEN"))
+    # Sleep for Retry-After and retry on HTTP 429 instead of failing the call
+    client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=2))
+    return client
+
+
+def slack_post(
+    channel: str,
+    text: str,
+    *,
+    thread_ts: str | None = None,
+    blocks: list[dict] | None = None,
+) -> tuple[str, str]:
+    """Post a message; returns (channel, ts). With `blocks`, `text` is the notification fallback."""
     client = slack_client()
+    _post_limiter(channel).acquire()
     try:
-        resp = client.chat_postMessage(channel=channel, text=text, thread_ts=thread_ts)
+        resp = client.chat_postMessage(
+            channel=channel, text=text, thread_ts=thread_ts, blocks=blocks
+        )
         return resp["channel"], resp["ts"]
     except SlackApiError as e:
         raise RuntimeError(f"Slack post failed: {e.response['error']}") from e
 
 
+def slack_post_many(channel: str, texts: list[str], *, thread_ts: str | None = None) -> list[str]:
+    """Post messages one after another; returns their ts in input order.
+
+    Sequential on purpose: the per-channel limiter allows ~1 post/s anyway, so posting from a
+    pool would save at most one round trip and could not guarantee arrival order.
+    """
+    return [slack_post(channel, text, thread_ts=thread_ts)[1] for text in texts]
+
+
 def slack_add_reaction(channel: str, ts: str, name: str) -> None:
     client = slack_client()
+    _READ_LIMITER.acquire()
     client.reactions_add(channel=channel, timestamp=ts, name=name)
 
 
-def slack_history(channel: str, oldest_ts: float | None = None, limit: int = 100) -> list[dict]:
+def _ack_posted(channel: str, ts: str, text: str, *, thread_ts: str) -> None:
+    """Mark message `ts` handled (🤖) and post `text`, overlapping the two Slack calls."""
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        reacted = pool.submit(slack_add_reaction, channel, ts, ROBOT_REACTION)
+        slack_post(channel, text, thread_ts=thread_ts)
+        reacted.result()
+
+
+def slack_history(
+    channel: str,
+    oldest_ts: float | None = None,
+    limit: int = 100,
+    *,
+    latest_ts: float | None = None,
+) -> list[dict]:
+    """Channel messages in (oldest_ts, latest_ts], newest first; bound both to keep it small."""
     client = slack_client()
-    resp = client.conversations_history(channel=channel, limit=limit, oldest=oldest_ts)
+    _READ_LIMITER.acquire()
+    resp = client.conversations_history(
+        channel=channel, limit=limit, oldest=oldest_ts, latest=latest_ts
+    )
     return list(resp.get("messages", []))
 
 
 def slack_thread_replies(channel: str, thread_ts: str, limit: int = 100) -> list[dict]:
     client = slack_client()
+    _READ_LIMITER.acquire()
     resp = client.conversations_replies(channel=channel, ts=thread_ts, limit=limit)
     # First element is the parent; include replies only
     msgs = list(resp.get("messages", []))
@@ -206,6 +589,7 @@ def slack_get_message(channel: str, ts: str) -> dict | None:
     """Fetch a single message (best-effort, exact by ts)."""
     client = slack_client()
     # Prefer an exact history window so we can read reactions on reply messages
+    _READ_LIMITER.acquire()
     try:
         resp = client.conversations_history(
             channel=channel, latest=ts, oldest=ts, inclusive=True, limit=1
@@ -216,6 +600,7 @@ def slack_get_message(channel: str, ts: str) -> dict | None:
     except Exception:
         pass
     # Fallback to replies when ts is the parent thread
+    _READ_LIMITER.acquire()
     try:
         resp = client.conversations_replies(channel=channel, ts=ts, limit=1)
         msgs = list(resp.get("messages", []))
@@ -227,6 +612,7 @@ def slack_get_message(channel: str, ts: str) -> dict | None:
 # ---- X (Twitter) ----
 
 
+@functools.lru_cache(maxsize=1)
 def twitter_api_v1():
     if tweepy is None:
         raise RuntimeError("tweepy package is not installed")
@@ -238,6 +624,7 @@ def twitter_api_v1():
     return tweepy.API(auth)
 
 
+@functools.lru_cache(maxsize=1)
 def twitter_client_v2():
     if tweepy is None:
         raise RuntimeError("tweepy package is not installed")
@@ -263,12 +650,18 @@ def _ensure_data_dir() -> str:
     return data_dir
 
 
+_DIGIT_RE = re.compile(r"\d")
+_EMOJI_RE = re.compile(r"[\U0001F300-\U0001FAFF]")
+_NUMBER_RE = re.compile(r"\d+")
+
+
 def _text_features(text: str) -> dict[str, object]:
     return {
         "len": len(text),
-        "has_numbers": bool(re.search(r"\d", text)),
+        "has_numbers": bool(_DIGIT_RE.search(text)),
         "asks_question": "?" in text,
-        "emoji_count": len(re.findall(r"[\U0001F300-\U0001FAFF]", text)),
+        # Emoji are all non-ASCII, so the C-level isascii() scan skips the regex for plain tweets
+        "emoji_count": 0 if text.isascii() else len(_EMOJI_RE.findall(text)),
         "lines": len(text.splitlines()),
     }
 
@@ -343,9 +736,10 @@ def _background_metrics_fetch() -> None:
 
 
 def post_to_x(text: str) -> str:
-    api = twitter_api_v1()
-    status = api.update_status(status=text[:280])
-    tid = str(getattr(status, "id", ""))
+    # v2 create_tweet on the shared client; v1.1 statuses/update is deprecated
+    resp = twitter_client_v2().create_tweet(text=text[:280])
+    tid = str(getattr(resp, "data", {}).get("id", ""))
+    _bump_daily_counter("posted_to_x_today")
     _log_event(
         {
             "type": "post",
@@ -381,6 +775,96 @@ def reply_to_tweet(tweet_id: str, text: str, *, handle: str | None = None) -> st
 # ---- Creator Map monitor (stub) ----
 
 
+_SEARCH_QUERY_MAX_LEN = 512  # X API v2 recent-search query limit (Basic tier)
+_USERS_LOOKUP_MAX = 100  # usernames per GET /2/users/by request
+# Reads overlap on a small pool; the bucket keeps them under the 300 req / 15 min app limit
+_TWITTER_WORKERS = 4
+_TWITTER_READ_LIMITER = _RateLimiter(300, 900.0)
+_SEARCH_QUERY_SUFFIX = " -is:retweet -is:reply"
+
+
+def _twitter_read(method, **kwargs) -> list:
+    """Call a tweepy.Client read method under the shared rate limit; returns `.data` or []."""
+    _TWITTER_READ_LIMITER.acquire()
+    return method(**kwargs).data or []
+
+
+def _get_users(client, usernames: list[str], **kwargs) -> list:
+    """Resolve usernames to users, one lookup per 100 names, run concurrently."""
+    chunks = [
+        usernames[i : i + _USERS_LOOKUP_MAX] for i in range(0, len(usernames), _USERS_LOOKUP_MAX)
+    ]
+    with ThreadPoolExecutor(max_workers=_TWITTER_WORKERS) as pool:
+        results = pool.map(
+            lambda chunk: _twitter_read(client.get_users, usernames=chunk, **kwargs), chunks
+        )
+        return [u for users in results for u in users]
+
+
+def _search_query(terms: list[str]) -> str:
+    return "(" + " OR ".join(terms) + ")" + _SEARCH_QUERY_SUFFIX
+
+
+def _search_queries(usernames: list[str]) -> list[str]:
+    """Pack usernames into as few '(from:a OR from:b ...)' queries as the length limit allows."""
+    queries: list[str] = []
+    terms: list[str] = []
+    for name in usernames:
+        term = f"from:{name}"
+        if terms and len(_search_query([*terms, term])) > _SEARCH_QUERY_MAX_LEN:
+            queries.append(_search_query(terms))
+            terms = []
+        terms.append(term)
+    if terms:
+        queries.append(_search_query(terms))
+    return queries
+
+
+_TWEETS_CACHE_TTL_SEC = 300
+# uid -> (time bucket, latest tweets); shared by the urgent check and the opportunity scan
+_TWEETS_CACHE: dict[str, tuple[int, list]] = {}
+
+
+def _recent_tweets_by_author(client, users: list, per_user: int = 5) -> dict[str, list]:
+    """Latest original tweets per author id (str), via batched search instead of per-user calls.
+
+    Authors fetched within the current 5-minute bucket are served from `_TWEETS_CACHE`.
+    """
+    bucket_key = int(time.time() // _TWEETS_CACHE_TTL_SEC)
+    by_author: dict[str, list] = {}
+    fresh: dict[str, list] = {}
+    to_fetch: list = []
+    for u in users:
+        cached = _TWEETS_CACHE.get(str(u.id))
+        if cached and cached[0] == bucket_key:
+            by_author[str(u.id)] = cached[1]
+        else:
+            fresh[str(u.id)] = []
+            to_fetch.append(u)
+
+    def search(query: str) -> list:
+        return _twitter_read(
+            client.search_recent_tweets,
+            query=query,
+            max_results=100,
+            tweet_fields=["created_at", "public_metrics", "author_id"],
+        )
+
+    queries = _search_queries([u.username for u in to_fetch])
+    with ThreadPoolExecutor(max_workers=_TWITTER_WORKERS) as pool:
+        results = list(pool.map(search, queries))
+    for tweets in results:
+        # Results are newest-first, so the first `per_user` per author are the latest
+        for tw in tweets:
+            bucket = fresh.get(str(tw.author_id))
+            if bucket is not None and len(bucket) < per_user:
+                bucket.append(tw)
+    for uid, tweets in fresh.items():
+        _TWEETS_CACHE[uid] = (bucket_key, tweets)
+    by_author.update(fresh)
+    return by_author
+
+
 def _detect_urgent_opportunities() -> list[str]:
     """Detect urgent opportunities: AMA/Q&A posts <5min old with >20 replies."""
     creators = _load_creators()
@@ -388,8 +872,9 @@ def _detect_urgent_opportunities() -> list[str]:
     if not tier1:
         return []
     client = twitter_client_v2()
-    users = client.get_users(usernames=tier1, user_fields=["public_metrics"]).data or []
+    users = _get_users(client, tier1, user_fields=["public_metrics"])
     id_by_username = {u.username.lower(): u.id for u in users}
+    tweets_by_author = _recent_tweets_by_author(client, users)
 
     now = dt.datetime.now(dt.timezone.utc)
     alerts: list[str] = []
@@ -398,16 +883,7 @@ def _detect_urgent_opportunities() -> list[str]:
         uid = id_by_username.get(name.lower())
         if not uid:
             continue
-        tweets = (
-            client.get_users_tweets(
-                id=uid,
-                max_results=5,
-                tweet_fields=["created_at", "public_metrics"],
-                exclude=["retweets", "replies"],
-            ).data
-            or []
-        )
-        for tw in tweets:
+        for tw in tweets_by_author.get(str(uid), []):
             text = str(getattr(tw, "text", "")).lower()
             created_at = tw.created_at if hasattr(tw, "created_at") else None
             if not created_at:
@@ -440,30 +916,58 @@ def monitor_creator_map() -> list[str]:
 # ---- Main flows ----
 
 
+_BULLET_CHARS = frozenset("-•")
+
+
 def _extract_tweets_from_suggestions(s: str) -> list[str]:
-    lines = [ln.rstrip() for ln in s.splitlines()]
+    """Return up to 5 bullets from the "Tweets" section (fallback: first 3 bullets anywhere).
+
+    Single pass over the raw string: lines are located with str.find and only the final
+    bullet texts are sliced out, so no per-line strings are allocated.
+    """
     tweets: list[str] = []
+    fallback: list[str] = []
     in_tweets = False
-    for ln in lines:
-        if ln.strip().lower().startswith("tweets"):
-            in_tweets = True
+    done = False  # past the "Reply ..." section; only fallback bullets are still collected
+    i, n = 0, len(s)
+    while i < n:
+        j = s.find("\n", i)
+        if j == -1:
+            j = n
+        start, end = i, j
+        i = j + 1
+        while start < end and s[start].isspace():
+            start += 1
+        while end > start and s[end - 1].isspace():
+            end -= 1
+        if start == end:
             continue
-        if in_tweets and ln.strip().lower().startswith("reply"):
-            break
-        if in_tweets and ln.strip().startswith(("-", "•")):
-            stripped = ln.lstrip("- ").lstrip("• ").strip()
-            if stripped:
-                tweets.append(stripped)
-    # Fallback: if none parsed, take first three bullet-like lines anywhere
-    if not tweets:
-        for ln in lines:
-            if ln.strip().startswith(("-", "•")):
-                stripped = ln.lstrip("- ").lstrip("• ").strip()
-                if stripped:
-                    tweets.append(stripped)
-            if len(tweets) >= 3:
+        if not done:
+            head = s[start : start + 6].lower()
+            if head.startswith("tweets"):
+                in_tweets = True
+                continue
+            if in_tweets and head.startswith("reply"):
+                if tweets:
+                    break
+                in_tweets, done = False, True
+                continue
+        if s[start] not in _BULLET_CHARS:
+            continue
+        k = start
+        while k < end and (s[k] in _BULLET_CHARS or s[k].isspace()):
+            k += 1
+        if k == end:
+            continue
+        if in_tweets:
+            tweets.append(s[k:end])
+            if len(tweets) >= 5:
                 break
-    return tweets[:5]
+        elif len(fallback) < 3:
+            fallback.append(s[k:end])
+        elif done:
+            break  # no Tweets section left to find and the fallback is full
+    return tweets or fallback
 
 
 def _pick_theme() -> str:
@@ -485,8 +989,12 @@ def _pick_theme() -> str:
         theme = random.choice(list(themes.keys()))
     else:
         theme = max(themes, key=lambda k: themes[k])
-    s["themes"] = themes
-    _save_budget_state(s)
+    if "themes" not in s:
+        # Re-read under the lock so the save cannot drop another task's concurrent update
+        with _STATE_LOCK:
+            s = _load_budget_state()
+            s.setdefault("themes", themes)
+            _save_budget_state(s)
     return theme
 
 
@@ -603,8 +1111,10 @@ def wait_for_user_reaction(
 
 
 def _reaction_selected(msg: dict, names: list[str]) -> bool:
-    reactions = {rv.get("name"): rv.get("count", 0) for rv in msg.get("reactions", [])}
-    return any(reactions.get(n, 0) > 0 for n in names)
+    """True if any of `names` is reacted on `msg` (direct scan, no per-message dict)."""
+    return any(
+        rv.get("name") in names and rv.get("count", 0) > 0 for rv in msg.get("reactions", [])
+    )
 
 
 def _wait_for_user_response(
@@ -707,7 +1217,7 @@ def follow_icp_batch(limit: int = 10) -> list[str]:
         if not all_handles:
             return []
         client = twitter_client_v2()
-        users = client.get_users(usernames=all_handles).data or []
+        users = _get_users(client, all_handles)
         queue: list[str] = []
         for u in users:
             if getattr(u, "id", None) and int(u.id) not in friend_ids:
@@ -761,14 +1271,19 @@ def run_morning_session() -> None:
     try:
         suggestions = generate_suggestions()
         tweets = _extract_tweets_from_suggestions(suggestions)[:3]
-        while len(tweets) < 3:
-            tweets.append("[placeholder tweet]")
     except Exception as e:
         slack_post(channel, f"❌ Error generating tweets: {e}")
         return
+    if not tweets:
+        # Nothing to pick from: skip the options post and the 30-min reaction poll
+        slack_post(channel, "⚠️ No tweet options returned; skipping morning session")
+        return
+    while len(tweets) < 3:
+        tweets.append("[placeholder tweet]")
 
     opt_text = f"**STEP 1: Pick your tweet**\n\n1️⃣ {tweets[0]}\n\n2️⃣ {tweets[1]}\n\n3️⃣ {tweets[2]}\n\nReact 1️⃣2️⃣3️⃣ to post · or reply 'edit 1: your text' to customize"
     _, opt_ts = slack_post(channel, opt_text)
+    _bump_daily_counter("morning_suggestions_today")
     try:
         for r in ("one", "two", "three"):
             slack_add_reaction(channel, opt_ts, r)
@@ -790,6 +1305,11 @@ def run_morning_session() -> None:
         except Exception:
             pass
         tid = post_to_x(text)
+        try:
+            # Mark handled so the pending-options watcher doesn't post it again
+            slack_add_reaction(channel, opt_ts, ROBOT_REACTION)
+        except Exception:
+            pass
         slack_post(channel, f"✅ Posted morning tweet (id={tid})")
     else:
         slack_post(channel, "⏭️ Skipped tweet posting")
@@ -818,6 +1338,10 @@ def run_morning_session() -> None:
     slack_post(channel, "🎉 MORNING SESSION COMPLETE — see you at 14:00 CET")
 
 
+_AFTERNOON_DONE_TEXT = "Afternoon session done. Monitoring for urgent opportunities."
+_CONTEXT_SAVED_TEXT = f"{COACH_TAG} Updated context saved."
+
+
 def run_afternoon_session() -> None:
     channel = env_required("SLACK_CHANNEL_ID")
     # Step 1: context refresh
@@ -834,16 +1358,13 @@ def run_afternoon_session() -> None:
     new_ctx = None
     while dt.datetime.now(dt.timezone.utc) < deadline:
         replies = slack_thread_replies(channel, ts, limit=50)
-        text_blobs = [r.get("text") or "" for r in replies if (r.get("text") or "").strip()]
+        text_blobs = [t for r in replies if (t := r.get("text") or "").strip()]
         if text_blobs:
             new_ctx = "\n".join(text_blobs).strip()
             break
         # If user reacted skip, break
         parent = slack_get_message(channel, ts)
-        if parent and any(
-            rv.get("name") == "next_track_button" and rv.get("count", 0) > 0
-            for rv in parent.get("reactions", [])
-        ):
+        if parent and _reaction_selected(parent, ["next_track_button"]):
             break
         time.sleep(10)
     # Update weekly_context if provided
@@ -852,7 +1373,7 @@ def run_afternoon_session() -> None:
         if new_ctx:
             prof["weekly_context"] = new_ctx
             _save_voice_profile(prof)
-            slack_post(channel, f"{COACH_TAG} Updated context saved.")
+            slack_post(channel, _CONTEXT_SAVED_TEXT)
         else:
             new_ctx = prof.get("weekly_context") or prof.get("recent_work") or ""
     except Exception:
@@ -875,7 +1396,7 @@ def run_afternoon_session() -> None:
         channel, ats, {"yes": ["+1", "thumbsup"], "no": ["thumbsdown"]}, timeout_sec=1800
     )
     if resp != "yes":
-        slack_post(channel, "Afternoon session done. Monitoring for urgent opportunities.")
+        slack_post(channel, _AFTERNOON_DONE_TEXT)
         return
 
     # Temporarily inject context into profile for this generation
@@ -883,8 +1404,15 @@ def run_afternoon_session() -> None:
     if new_ctx:
         prof["weekly_context"] = new_ctx
         _save_voice_profile(prof)
-    suggestions = generate_suggestions()
-    tweets = _extract_tweets_from_suggestions(suggestions)[:3]
+    try:
+        suggestions = generate_suggestions()
+        tweets = _extract_tweets_from_suggestions(suggestions)[:3]
+    except Exception as e:
+        slack_post(channel, f"❌ Error generating tweets: {e}")
+        return
+    if not tweets:
+        slack_post(channel, "⚠️ No tweet options returned. Afternoon session done.")
+        return
     while len(tweets) < 3:
         tweets.append("[placeholder tweet]")
     opt_text = f"1️⃣ {tweets[0]}\n\n2️⃣ {tweets[1]}\n\n3️⃣ {tweets[2]}\n\nReact 1️⃣2️⃣3️⃣ to post"
@@ -908,26 +1436,43 @@ def run_afternoon_session() -> None:
         except Exception:
             pass
         tid = post_to_x(text)
+        try:
+            # Mark handled so the pending-options watcher doesn't post it again
+            slack_add_reaction(channel, opt_ts, ROBOT_REACTION)
+        except Exception:
+            pass
         slack_post(channel, f"✅ Posted afternoon update (id={tid})")
-    slack_post(channel, "Afternoon session done. Monitoring for urgent opportunities.")
+    slack_post(channel, _AFTERNOON_DONE_TEXT)
+
+
+# Minimal placeholder: real impl would search X for targets
+_REPLY_ENGINE_TEXT = (
+    f"{COACH_TAG} Reply targets (5) with suggested drafts\n"
+    "1) @target1: <draft>\n2) @target2: <draft>\n3) @target3: <draft>\n4) @target4: <draft>\n5) @target5: <draft>"
+)
 
 
 def run_reply_engine() -> None:
     channel = env_required("SLACK_CHANNEL_ID")
-    # Minimal placeholder: real impl would search X for targets
-    text = (
-        f"{COACH_TAG} Reply targets (5) with suggested drafts\n"
-        "1) @target1: <draft>\n2) @target2: <draft>\n3) @target3: <draft>\n4) @target4: <draft>\n5) @target5: <draft>"
-    )
-    slack_post(channel, text)
+    slack_post(channel, _REPLY_ENGINE_TEXT)
+
+
+_CREATORS_CACHE: dict[str, tuple[int, dict[str, list[str]]]] = {}
 
 
 def _load_creators() -> dict[str, list[str]]:
+    """Load creators.json; parsed once and reused until the file's mtime changes."""
     path = os.path.join(os.path.dirname(__file__), "..", "..", "creators.json")
     path = os.path.abspath(path)
     try:
+        mtime = os.stat(path).st_mtime_ns
+        cached = _CREATORS_CACHE.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
         with open(path, encoding="utf-8") as f:
-            return json.load(f)
+            creators = json.load(f)
+        _CREATORS_CACHE[path] = (mtime, creators)
+        return creators
     except Exception:
         return {"tier1": [], "tier2": [], "tier3": []}
 
@@ -945,34 +1490,40 @@ class Opportunity:
     tweet_id: str
 
 
+_TIER_BOOST = {1: 50, 2: 20}
+
+
 def _score_opportunity(tier: int, metrics: dict, minutes_ago: float) -> int:
-    likes = metrics.get("like_count", 0)
-    rts = metrics.get("retweet_count", 0) + metrics.get("repost_count", 0)
-    replies = metrics.get("reply_count", 0)
-    base = likes * 1 + rts * 2 + replies * 3
+    get = metrics.get
+    base = (
+        get("like_count", 0)
+        + 2 * (get("retweet_count", 0) + get("repost_count", 0))
+        + 3 * get("reply_count", 0)
+    )
     recency = max(0, 120 - minutes_ago)  # fresh boost
-    tier_boost = 50 if tier == 1 else (20 if tier == 2 else 0)
-    score = int(min(100, (base**0.5) + recency * 0.2 + tier_boost))
-    return score
+    return int(min(100, math.sqrt(base) + recency * 0.2 + _TIER_BOOST.get(tier, 0)))
 
 
 def _fetch_opportunities() -> list[tuple[Opportunity, int]]:
     creators = _load_creators()
-    users_by_tier: list[tuple[int, list[str]]] = [
-        (1, creators.get("tier1", [])),
-        (2, creators.get("tier2", [])),
-        (3, creators.get("tier3", [])),
-    ]
+    # A handle listed in several tiers is only scored in its highest one
+    users_by_tier: list[tuple[int, list[str]]] = []
+    seen: set[str] = set()
+    for tier in (1, 2, 3):
+        names = [n for n in creators.get(f"tier{tier}", []) if n.lower() not in seen]
+        seen.update(n.lower() for n in names)
+        users_by_tier.append((tier, names))
     client = twitter_client_v2()
     # Resolve usernames to IDs
     usernames = [u for _, lst in users_by_tier for u in lst]
     if not usernames:
         return []
-    users = client.get_users(usernames=usernames, user_fields=["public_metrics"]).data or []
+    users = _get_users(client, usernames, user_fields=["public_metrics"])
     id_by_username = {u.username.lower(): u.id for u in users}
     followers_by_username = {
         u.username.lower(): (u.public_metrics or {}).get("followers_count", 0) for u in users
     }
+    tweets_by_author = _recent_tweets_by_author(client, users)
 
     now = dt.datetime.now(dt.timezone.utc)
     opps: list[tuple[Opportunity, int]] = []
@@ -981,16 +1532,7 @@ def _fetch_opportunities() -> list[tuple[Opportunity, int]]:
             uid = id_by_username.get(name.lower())
             if not uid:
                 continue
-            tweets = (
-                client.get_users_tweets(
-                    id=uid,
-                    max_results=5,
-                    tweet_fields=["created_at", "public_metrics"],
-                    exclude=["retweets", "replies"],
-                ).data
-                or []
-            )
-            for tw in tweets:
+            for tw in tweets_by_author.get(str(uid), []):
                 created_at = tw.created_at if hasattr(tw, "created_at") else None
                 minutes_ago = (now - created_at).total_seconds() / 60 if created_at else 9999
                 metrics = tw.public_metrics or {}
@@ -1015,51 +1557,81 @@ def _fetch_opportunities() -> list[tuple[Opportunity, int]]:
                 opps.append((opp, tier))
     # Select shortlist per rules
     # Always show all tier1; tier2 if score>80; tier3 if score>90; cap 15
-    shortlist = [o for o, t in opps if t == 1]
-    shortlist += [o for o, t in opps if t == 2 and o.score >= 80]
-    shortlist += [o for o, t in opps if t == 3 and o.score >= 90]
-    shortlist.sort(key=lambda o: o.score, reverse=True)
+    shortlist = [
+        o for o, t in opps if t == 1 or (t == 2 and o.score >= 80) or (t == 3 and o.score >= 90)
+    ]
+    shortlist.sort(key=operator.attrgetter("score"), reverse=True)
     for i, o in enumerate(shortlist[:15], start=1):
         o.idx = i
     return [(o, 0) for o in shortlist[:15]]
 
 
-def _post_opportunity_shortlist(channel: str, opps: list[Opportunity]) -> tuple[str, list[str]]:
+def _post_opportunity_shortlist(channel: str, opps: list[Opportunity]) -> str:
+    """Post the whole shortlist as one Block Kit message; returns its ts.
+
+    Items are picked by replying "create: 1,4,6" in the thread, so they need no message each.
+    """
     header = f'{COACH_TAG} Opportunities shortlist (reply "create: 1,4,6" to draft)'
-    _, ts = slack_post(channel, header)
-    posted_ts: list[str] = []
+    blocks: list[dict] = [{"type": "section", "text": {"type": "mrkdwn", "text": header}}]
     for o in opps:
         line = (
-            f"{o.idx}) @{o.user} — {o.summary}\n"
+            f"*{o.idx})* @{o.user} — {o.summary}\n"
             f"Why: {o.why} | Score: {o.score} | Metrics: {o.metrics} | Followers: {o.followers}\n"
             f"tweet_id={o.tweet_id}"
         )
-        _, child_ts = slack_post(channel, line, thread_ts=ts)
-        posted_ts.append(child_ts)
-    return ts, posted_ts
+        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": line}})
+    _, ts = slack_post(channel, header, blocks=blocks)
+    return ts
 
 
 def _parse_selection(text: str) -> list[int]:
     # e.g., "create: 1,4,6" or "1 4 6"
-    import re
+    return list(map(int, _NUMBER_RE.findall(text)))
 
-    m = re.findall(r"\d+", text)
-    return [int(x) for x in m]
 
-
-def _generate_reply_single(tweet_text: str, username: str, tone: str = "safe") -> str:
-    """Generate a single reply (safe by default). tone in {"safe","spicy"}."""
+def _reply_system(tone: str = "safe") -> str:
     style = os.getenv("ANTHROPIC_STYLE_CEO", _STYLE_CEO_DEFAULT)
-    base = (
-        "Draft ONE concise Twitter reply (<=280 chars) to the tweet below.\n"
+    # Everything but the tweet is constant across drafts, so it goes in the cached system block
+    system = (
+        "Draft ONE concise Twitter reply (<=280 chars) to the tweet in the user message.\n"
         "Voice/style: follow this strictly:\n"
         + style
         + "\nUse everyday language; avoid buzzwords (e.g., 'first principles')."
     )
     if tone == "spicy":
-        base += "\nMake it slightly contrarian/spicy but respectful; one sharp point; no fluff."
-    prompt = base + "\nTweet by @" + username + ":\n" + tweet_text + "\nReturn only the reply text."
-    return _anthropic_complete(prompt, task="replies")
+        system += "\nMake it slightly contrarian/spicy but respectful; one sharp point; no fluff."
+    system += "\nReturn only the reply text."
+    return system
+
+
+def _reply_prompt(tweet_text: str, username: str) -> str:
+    return "Tweet by @" + username + ":\n" + tweet_text
+
+
+def _generate_replies(targets: dict[str, tuple[str, str]], tone: str = "safe") -> dict[str, str]:
+    """Draft replies for {custom_id: (tweet_text, username)}.
+
+    Several drafts go through one Message Batches request; ids the batch did not return
+    within _DRAFT_BATCH_TIMEOUT_SEC are drafted with live calls.
+    """
+    system = _reply_system(tone)
+    prompts = {cid: _reply_prompt(text, user) for cid, (text, user) in targets.items()}
+    drafts: dict[str, str] = {}
+    if len(prompts) > 1:
+        try:
+            drafts = _anthropic_batch_complete(
+                prompts,
+                task="replies",
+                timeout_sec=_DRAFT_BATCH_TIMEOUT_SEC,
+                system=system,
+                max_poll_sec=_DRAFT_BATCH_POLL_SEC,
+            )
+        except Exception as e:
+            _log_event({"type": "error", "where": "draft_batch", "error": str(e)})
+    for cid, prompt in prompts.items():
+        if not drafts.get(cid):
+            drafts[cid] = _anthropic_complete(prompt, task="replies", system=system)
+    return drafts
 
 
 def _load_budget_state() -> dict:
@@ -1079,28 +1651,50 @@ def _save_budget_state(s: dict) -> None:
     root = os.path.dirname(os.path.abspath(__file__))
     state_dir = os.path.abspath(os.path.join(root, "..", "..", "data"))
     os.makedirs(state_dir, exist_ok=True)
-    path = os.path.join(state_dir, "state.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(s, f)
+    atomic_write(os.path.join(state_dir, "state.json"), json.dumps(s).encode())
 
 
-def _budget_allow(cost: float) -> bool:
-    budget = float(os.getenv("DAILY_TOKEN_BUDGET_USD", "0.50"))
+# Held around every load-modify-save of state.json: service tasks run on several threads
+_STATE_LOCK = threading.Lock()
+
+_DAILY_STATE = {"spend": 0.0, "drafts": 0, "morning_suggestions_today": 0, "posted_to_x_today": 0}
+
+
+def _roll_daily_state(s: dict) -> None:
+    """Reset the per-day fields of state dict `s` when the UTC date has changed."""
     today = dt.datetime.now(dt.timezone.utc).date().isoformat()
-    s = _load_budget_state()
     if s.get("date") != today:
-        s = {"date": today, "spend": 0.0, "drafts": 0}
+        s.update(_DAILY_STATE, date=today)
+
+
+def _bump_daily_counter(name: str) -> None:
+    """Increment today's `name` counter in state.json; counting must never break a run."""
+    try:
+        with _STATE_LOCK:
+            s = _load_budget_state()
+            _roll_daily_state(s)
+            s[name] = s.get(name, 0) + 1
+            _save_budget_state(s)
+    except Exception:
+        pass
+
+
+def _budget_allow(cost: float, s: dict) -> bool:
+    """Charge `cost` to today's budget in state dict `s` (in place); the caller saves it."""
+    budget = float(os.getenv("DAILY_TOKEN_BUDGET_USD", "0.50"))
+    _roll_daily_state(s)
     if s["spend"] + cost > budget:
-        _save_budget_state(s)
         return False
     s["spend"] += cost
     s["drafts"] += 1
-    _save_budget_state(s)
     return True
 
 
 _SINGLE_VARIANT = os.getenv("REPLIES_SINGLE_VARIANT", "true").lower() == "true"
 _COST_PER_DRAFT = float(os.getenv("ESTIMATED_COST_PER_DRAFT_USD", "0.04"))
+_DRAFT_BATCH_TIMEOUT_SEC = int(os.getenv("DRAFT_BATCH_TIMEOUT_SEC", "90"))
+# Drafts are waited on interactively, so the batch is polled at a short, fixed interval
+_DRAFT_BATCH_POLL_SEC = 5.0
 
 
 def run_opportunity_scan() -> None:
@@ -1111,10 +1705,11 @@ def run_opportunity_scan() -> None:
     if not opps:
         print("No opportunities found, skipping Slack post")
         return
-    header_ts, _ = _post_opportunity_shortlist(channel, opps)
+    header_ts = _post_opportunity_shortlist(channel, opps)
 
-    # Stage 2 trigger: check for selection replies under header
-    replies = slack_thread_replies(channel, header_ts, limit=100)
+    # Stage 2 trigger: check for selection replies under header. This one fetch also feeds
+    # the post/edit/👍 scan below; drafts posted in this run cannot have responses yet.
+    replies = slack_thread_replies(channel, header_ts, limit=200)
     selected: list[int] = []
     want_spicy = False
     for r in replies:
@@ -1128,33 +1723,50 @@ def run_opportunity_scan() -> None:
         return  # wait for user selection next run
 
     by_idx = {o.idx: o for o in opps}
-    for idx in selected:
-        o = by_idx.get(idx)
-        if not o:
-            continue
-        # Budget check before generating
-        if not _budget_allow(_COST_PER_DRAFT):
-            slack_post(
-                channel,
-                f"{COACH_TAG} Budget reached; drafts paused for today.",
-                thread_ts=header_ts,
-            )
-            return
-        # Get tweet text for generation
+    # Charge the whole batch up front in one load-modify-save, so the state is not held (and
+    # then written back over other tasks' counter bumps) across the slow drafting below
+    budget_hit = False
+    to_draft: list[tuple[int, Opportunity]] = []
+    with _STATE_LOCK:
+        budget_state = _load_budget_state()
+        for idx in selected:
+            o = by_idx.get(idx)
+            if not o:
+                continue
+            # Budget check before generating
+            if not _budget_allow(_COST_PER_DRAFT, budget_state):
+                budget_hit = True
+                break
+            to_draft.append((idx, o))
+        if to_draft:
+            _save_budget_state(budget_state)
+    # Get tweet texts for generation in one lookup (up to 100 ids per call)
+    text_by_id: dict[str, str] = {}
+    if to_draft:
         client = twitter_client_v2()
-        tw = client.get_tweet(id=o.tweet_id, tweet_fields=["text"]).data
-        tweet_text = getattr(tw, "text", o.summary)
-        tone = "spicy" if want_spicy else "safe"
-        reply = _generate_reply_single(tweet_text, o.user, tone=tone)
-        # Post single draft in thread; 👍 to post
+        ids = [o.tweet_id for _, o in to_draft]
+        tweets = client.get_tweets(ids=ids, tweet_fields=["text"]).data or []
+        text_by_id = {str(tw.id): tw.text for tw in tweets}
+    targets = {f"opp-{idx}": (text_by_id.get(o.tweet_id, o.summary), o.user) for idx, o in to_draft}
+    drafts = _generate_replies(targets, tone="spicy" if want_spicy else "safe")
+    # One message per draft in the thread (👍 to post); the posts don't depend on each other
+    slack_post_many(
+        channel,
+        [
+            f"{COACH_TAG} Reply {idx} (tweet_id={o.tweet_id}):\n{drafts[f'opp-{idx}']}\n\nActions: 👍 to post · or reply in thread: 'post {idx}' or 'edit {idx}: <text>'"
+            for idx, o in to_draft
+        ],
+        thread_ts=header_ts,
+    )
+    if budget_hit:
         slack_post(
             channel,
-            f"{COACH_TAG} Reply {idx} (tweet_id={o.tweet_id}):\n{reply}\n\nActions: 👍 to post · or reply in thread: 'post {idx}' or 'edit {idx}: <text>'",
+            f"{COACH_TAG} Budget reached; drafts paused for today.",
             thread_ts=header_ts,
         )
+        return
 
     # Reaction-based posting for single drafts (👍) and typed commands (post/edit)
-    replies = slack_thread_replies(channel, header_ts, limit=200)
     # Index latest draft by idx
     latest_by_idx: dict[int, tuple[str, str]] = {}
     for msg in replies:
@@ -1192,9 +1804,9 @@ def run_opportunity_scan() -> None:
                 tid, reply_text = latest_by_idx[idx]
                 try:
                     rid = reply_to_tweet(tid, reply_text)
-                    slack_add_reaction(channel, ts, ROBOT_REACTION)
-                    slack_post(
+                    _ack_posted(
                         channel,
+                        ts,
                         f"{COACH_TAG} Replied on X (id={rid}) to {tid}",
                         thread_ts=header_ts,
                     )
@@ -1218,9 +1830,9 @@ def run_opportunity_scan() -> None:
                     tid, _old = latest_by_idx[idx]
                     try:
                         rid = reply_to_tweet(tid, new_text)
-                        slack_add_reaction(channel, ts, ROBOT_REACTION)
-                        slack_post(
+                        _ack_posted(
                             channel,
+                            ts,
                             f"{COACH_TAG} Replied on X (id={rid}) to {tid}",
                             thread_ts=header_ts,
                         )
@@ -1234,10 +1846,9 @@ def run_opportunity_scan() -> None:
         # Then handle 👍 on a draft message itself
         if "tweet_id=" not in txt:
             continue
-        reactions = {rv.get("name"): rv.get("count", 0) for rv in r.get("reactions", [])}
-        if reactions.get(ROBOT_REACTION, 0) > 0:
+        if _reaction_selected(r, [ROBOT_REACTION]):
             continue
-        if reactions.get("+1", 0) > 0 or reactions.get("thumbsup", 0) > 0:
+        if _reaction_selected(r, [THUMBS_UP, "thumbsup"]):
             # Extract tweet_id
             tid = None
             for part in txt.split():
@@ -1250,9 +1861,9 @@ def run_opportunity_scan() -> None:
                 reply_text = body[1].strip() if len(body) == 2 else txt
                 try:
                     rid = reply_to_tweet(tid, reply_text)
-                    slack_add_reaction(channel, ts, ROBOT_REACTION)
-                    slack_post(
+                    _ack_posted(
                         channel,
+                        ts,
                         f"{COACH_TAG} Replied on X (id={rid}) to {tid}",
                         thread_ts=header_ts,
                     )
@@ -1262,9 +1873,12 @@ def run_opportunity_scan() -> None:
                     )
 
 
+_FOLLOW_RECS_TEXT = f"{COACH_TAG} Follow/DM recommendations:\n- @example1\n- @example2"
+
+
 def run_follow_recs() -> None:
     channel = env_required("SLACK_CHANNEL_ID")
-    slack_post(channel, f"{COACH_TAG} Follow/DM recommendations:\n- @example1\n- @example2")
+    slack_post(channel, _FOLLOW_RECS_TEXT)
 
 
 def _collect_recent_posts(hours: int = 24) -> list[dict]:
@@ -1290,38 +1904,52 @@ def _collect_recent_posts(hours: int = 24) -> list[dict]:
     return out
 
 
+def _split_posts(posts: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Split logged posts into (tweets, replies) in one pass."""
+    tweets: list[dict] = []
+    replies: list[dict] = []
+    for p in posts:
+        kind = p.get("kind")
+        if kind == "tweet":
+            tweets.append(p)
+        elif kind == "reply":
+            replies.append(p)
+    return tweets, replies
+
+
 def _update_theme_weights_from_metrics() -> tuple[str, float]:
     # Very simple: compute like velocity and reward the most successful theme in last 24h
-    s = _load_budget_state()
-    themes = s.get(
-        "themes",
-        {
-            "metrics": 1,
-            "build_in_public": 1,
-            "positioning": 1,
-            "technical": 1,
-            "hot_take": 1,
-        },
-    )
-    posts = _collect_recent_posts(24)
-    # If we had theme per post, we'd use it; for now, reward 'metrics' if numbers present, else 'positioning' when asks_question, otherwise 'build_in_public'
-    scores = {k: 0.0 for k in themes}
-    for ev in posts:
-        feats = ev.get("features", {})
-        if feats.get("has_numbers"):
-            scores["metrics"] += 1.0
-        elif feats.get("asks_question"):
-            scores["positioning"] += 0.7
-        else:
-            scores["build_in_public"] += 0.5
-    best = max(scores, key=lambda k: scores[k]) if scores else "metrics"
-    themes[best] = min(5, themes.get(best, 1) + 1)
-    # decay others
-    for k in themes:
-        if k != best:
-            themes[k] = max(1, int(themes[k] * 0.9))
-    s["themes"] = themes
-    _save_budget_state(s)
+    with _STATE_LOCK:
+        s = _load_budget_state()
+        themes = s.get(
+            "themes",
+            {
+                "metrics": 1,
+                "build_in_public": 1,
+                "positioning": 1,
+                "technical": 1,
+                "hot_take": 1,
+            },
+        )
+        posts = _collect_recent_posts(24)
+        # If we had theme per post, we'd use it; for now, reward 'metrics' if numbers present, else 'positioning' when asks_question, otherwise 'build_in_public'
+        scores = {k: 0.0 for k in themes}
+        for ev in posts:
+            feats = ev.get("features", {})
+            if feats.get("has_numbers"):
+                scores["metrics"] += 1.0
+            elif feats.get("asks_question"):
+                scores["positioning"] += 0.7
+            else:
+                scores["build_in_public"] += 0.5
+        best = max(scores, key=lambda k: scores[k]) if scores else "metrics"
+        themes[best] = min(5, themes.get(best, 1) + 1)
+        # decay others
+        for k in themes:
+            if k != best:
+                themes[k] = max(1, int(themes[k] * 0.9))
+        s["themes"] = themes
+        _save_budget_state(s)
     return best, scores.get(best, 0.0)
 
 
@@ -1354,9 +1982,7 @@ def run_summary() -> None:
     channel = env_required("SLACK_CHANNEL_ID")
 
     # Count posts from last 24h
-    posts = _collect_recent_posts(24)
-    tweets = [p for p in posts if p.get("kind") == "tweet"]
-    replies = [p for p in posts if p.get("kind") == "reply"]
+    tweets, replies = _split_posts(_collect_recent_posts(24))
 
     # Fetch latest metrics for today's tweets
     tweet_ids = [p["tweet_id"] for p in tweets]
@@ -1407,9 +2033,7 @@ def run_weekly_brief() -> None:
     channel = env_required("SLACK_CHANNEL_ID")
 
     # Collect last 7 days
-    posts = _collect_recent_posts(168)  # 7 days
-    tweets = [p for p in posts if p.get("kind") == "tweet"]
-    replies = [p for p in posts if p.get("kind") == "reply"]
+    tweets, replies = _split_posts(_collect_recent_posts(168))  # 7 days
 
     # Aggregate metrics from snapshots
     snapshots = _get_recent_metrics()
@@ -1457,9 +2081,7 @@ def run_weekly_brief() -> None:
 def run_ad_hoc_stats(query: str = "") -> None:
     """Ad-hoc stats command: show simple aggregated metrics (no LLM, just scrape)."""
     channel = env_required("SLACK_CHANNEL_ID")
-    posts = _collect_recent_posts(168)  # last 7 days
-    tweets = [p for p in posts if p.get("kind") == "tweet"]
-    replies = [p for p in posts if p.get("kind") == "reply"]
+    tweets, replies = _split_posts(_collect_recent_posts(168))  # last 7 days
 
     text = f"{COACH_TAG} Ad-hoc Stats\n"
     text += f"Last 7 days: {len(tweets)} tweets, {len(replies)} replies\n"
@@ -1478,20 +2100,33 @@ def run_learning_loop() -> None:
 
 
 def system_health_check() -> str:
-    try:
-        oldest = (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=1)).timestamp()
-        messages = slack_history(env_required("SLACK_CHANNEL_ID"), oldest_ts=oldest, limit=100)
-        morning = any("Suggestions for" in (m.get("text") or "") for m in messages)
-    except Exception:
-        morning = False
-    posts = _collect_recent_posts(24)
-    tweets = [p for p in posts if p.get("kind") == "tweet"]
-    replies = [p for p in posts if p.get("kind") == "reply"]
+    state = _load_budget_state()
+    today = state.get("date") == dt.datetime.now(dt.timezone.utc).date().isoformat()
+    if today and "morning_suggestions_today" in state:
+        # The morning session counts its options post, so no Slack history fetch is needed
+        morning = state["morning_suggestions_today"] > 0
+    else:
+        try:
+            # Only today's timeline matters (the morning run is 07:30 UTC); a rolling 24h
+            # window also pulled yesterday's traffic
+            now = dt.datetime.now(dt.timezone.utc)
+            oldest = now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+            messages = slack_history(
+                env_required("SLACK_CHANNEL_ID"),
+                oldest_ts=oldest,
+                limit=100,
+                latest_ts=now.timestamp(),
+            )
+            morning = any("Pick your tweet" in (m.get("text") or "") for m in messages)
+        except Exception:
+            morning = False
+    tweets, replies = _split_posts(_collect_recent_posts(24))
     metrics_ok = bool(_get_recent_metrics())
     lines = [
         "🏥 SYSTEM HEALTH",
         f"{'✅' if morning else '⚠️'} Morning: {'Found suggestions' if morning else 'Missing'}",
         f"✅ Posts: {len(tweets)} tweets, {len(replies)} replies (24h)",
+        f"✅ Posted to X today: {state.get('posted_to_x_today', 0) if today else 0}",
         f"{'✅' if metrics_ok else '⚠️'} Metrics: {'ok' if metrics_ok else 'no snapshots'}",
     ]
     return "\n".join(lines)
@@ -1500,15 +2135,22 @@ def system_health_check() -> str:
 def _process_pending_number_posts() -> None:
     """Watcher: if a suggestions/options message has 1️⃣/2️⃣/3️⃣ reactions later, post it."""
     channel = env_required("SLACK_CHANNEL_ID")
-    oldest = (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=1)).timestamp()
-    messages = slack_history(channel, oldest_ts=oldest, limit=300)
+    # Options are posted from 07:30 UTC on, so only messages since the last 07:00 UTC matter
+    now = dt.datetime.now(dt.timezone.utc)
+    since = now.replace(hour=7, minute=0, second=0, microsecond=0)
+    if since > now:
+        since -= dt.timedelta(days=1)
+    messages = slack_history(
+        channel, oldest_ts=since.timestamp(), limit=100, latest_ts=now.timestamp()
+    )
+    # Skip options already handled (🤖) but keep scanning: an older message can still get a
+    # late 1️⃣/2️⃣/3️⃣ after a newer one was handled; the window above bounds the scan
     for m in messages:
         text = m.get("text") or ""
         ts = m.get("ts")
         if not ts or "1️⃣ " not in text or "2️⃣ " not in text or "3️⃣ " not in text:
             continue
-        reactions = {rv.get("name"): rv.get("count", 0) for rv in m.get("reactions", [])}
-        if reactions.get(ROBOT_REACTION, 0) > 0:
+        if _reaction_selected(m, [ROBOT_REACTION]):
             continue
         # Parse options
         options: dict[int, str] = {}
@@ -1520,21 +2162,22 @@ def _process_pending_number_posts() -> None:
                 options[2] = ls.split("2️⃣ ", 1)[1].strip()
             elif ls.startswith("3️⃣ "):
                 options[3] = ls.split("3️⃣ ", 1)[1].strip()
-        selected = (
-            1
-            if reactions.get("one", 0) > 0
-            else 2
-            if reactions.get("two", 0) > 0
-            else 3
-            if reactions.get("three", 0) > 0
-            else None
+        selected = next(
+            (
+                n
+                for n, name in ((1, "one"), (2, "two"), (3, "three"))
+                if _reaction_selected(m, [name])
+            ),
+            None,
         )
         if selected and selected in options:
             try:
                 tid = post_to_x(options[selected])
-                slack_add_reaction(channel, ts, ROBOT_REACTION)
-                slack_post(
-                    channel, f"{COACH_TAG} Posted option {selected} to X (id={tid})", thread_ts=ts
+                _ack_posted(
+                    channel,
+                    ts,
+                    f"{COACH_TAG} Posted option {selected} to X (id={tid})",
+                    thread_ts=ts,
                 )
             except Exception as e:
                 slack_post(channel, f"{COACH_TAG} Error posting to X: {e}", thread_ts=ts)
@@ -1612,6 +2255,7 @@ def main(argv: Iterable[str] | None = None) -> int:
             "metrics",
             "setup",
             "refresh",
+            "daily",
             "none",
         ],
         default="suggest",
@@ -1640,6 +2284,8 @@ def main(argv: Iterable[str] | None = None) -> int:
         run_ad_hoc_stats()
     elif args.task == "metrics":
         run_background_metrics()
+    elif args.task == "daily":
+        run_daily_batch()
     elif args.task == "setup":
         try:
             from spark_coach.setup import run_setup_interview
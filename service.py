@@ -5,118 +5,165 @@ Handles scheduled tasks and monitors Slack for reactions.
 """
 
 import datetime as dt
-import sys
+import logging
+import queue
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from collections.abc import Callable
 
+import uvicorn
 from coach import (
     run_afternoon_session,
     run_background_metrics,
+    run_daily_batch,
     run_morning_session,
     run_opportunity_scan,
     run_summary,
     run_weekly_brief,
 )
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 TZ = dt.timezone(dt.timedelta(hours=1))  # CET
 
+logger = logging.getLogger("spark-coach")
 
-class HealthCheckHandler(BaseHTTPRequestHandler):
-    """Simple HTTP handler for health checks."""
 
-    def do_GET(self):
-        if self.path == "/health":
-            self.send_response(200)
-            self.send_header("Content-type", "text/plain")
-            self.end_headers()
-            self.wfile.write(b"OK")
-        else:
-            self.send_response(404)
-            self.end_headers()
+# Only /health is exposed on the public Fly port: no Slack routes, no /docs or OpenAPI schema
+health_app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
 
-    def log_message(self, format, *args):
-        # Suppress logs
-        pass
+
+@health_app.get("/health", response_class=PlainTextResponse)
+def health() -> str:
+    return "OK"
 
 
 def run_health_server():
-    """Run health check HTTP server on port 8080."""
-    server = HTTPServer(("0.0.0.0", 8080), HealthCheckHandler)
-    server.serve_forever()
+    """Serve the health check on port 8080 with uvicorn."""
+    config = uvicorn.Config(health_app, host="0.0.0.0", port=8080, log_level="warning")
+    # Off the main thread uvicorn leaves signal handling to the process
+    uvicorn.Server(config).run()
+
+
+# (task name, function, predicate on the UTC minute); weekday() is 0=Mon, 6=Sun
+TASKS = (
+    ("daily", run_daily_batch, lambda n: n.hour == 7 and n.minute == 0),
+    ("suggest", run_morning_session, lambda n: n.hour == 7 and n.minute == 30),
+    ("afternoon", run_afternoon_session, lambda n: n.hour == 13 and n.minute == 0),
+    ("summary", run_summary, lambda n: n.hour == 18 and n.minute == 0),
+    ("weekly", run_weekly_brief, lambda n: n.weekday() == 6 and n.hour == 19 and n.minute == 0),
+    ("scan", run_opportunity_scan, lambda n: n.hour in (9, 12, 15) and n.minute == 0),
+    ("metrics", run_background_metrics, lambda n: n.minute % 30 == 0),  # Every 30 minutes
+)
+_TASK_BIT = {task_name: 1 << i for i, (task_name, _func, _due) in enumerate(TASKS)}
+
+_MINUTES_PER_WEEK = 7 * 24 * 60
+
+
+def _minute_of_week(now: dt.datetime) -> int:
+    return (now.weekday() * 24 + now.hour) * 60 + now.minute
+
+
+def _build_fire_table() -> bytes:
+    """One byte per minute of the week; bit i is set when TASKS[i] is due in that minute."""
+    monday = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)  # any Monday 00:00
+    table = bytearray(_MINUTES_PER_WEEK)
+    for idx in range(_MINUTES_PER_WEEK):
+        t = monday + dt.timedelta(minutes=idx)
+        for i, (_name, _func, due) in enumerate(TASKS):
+            if due(t):
+                table[idx] |= 1 << i
+    return bytes(table)
+
+
+# The predicates above stay the source of truth; per tick this is a single index + bit test
+_FIRE = _build_fire_table()
 
 
 def should_run_task(task: str, now: dt.datetime) -> bool:
     """Check if a task should run at the current time."""
-    hour = now.hour
-    minute = now.minute
-    dow = now.weekday()  # 0=Mon, 6=Sun
-
-    if task == "suggest":
-        return hour == 7 and minute == 30
-    elif task == "afternoon":
-        return hour == 13 and minute == 0
-    elif task == "summary":
-        return hour == 18 and minute == 0
-    elif task == "weekly":
-        return dow == 6 and hour == 19 and minute == 0  # Sunday
-    elif task == "scan":
-        return hour in [9, 12, 15] and minute == 0
-    elif task == "metrics":
-        return minute % 30 == 0  # Every 30 minutes
-    return False
+    return bool(_FIRE[_minute_of_week(now)] & _TASK_BIT.get(task, 0))
+
+
+# Long-lived workers for scheduled tasks; the sessions can block for up to an hour waiting on
+# Slack reactions, so several workers are kept free for scans/metrics in the meantime.
+# They are daemon threads (unlike ThreadPoolExecutor's, which are joined at interpreter exit)
+# so SIGINT/SIGTERM stops the service at once instead of waiting out a reaction wait.
+TASK_WORKERS = 4
+_TASK_QUEUE: queue.SimpleQueue[tuple[str, Callable[[], object]]] = queue.SimpleQueue()
+
+
+def _task_worker() -> None:
+    while True:
+        task_name, task_func = _TASK_QUEUE.get()
+        run_task_safe(task_name, task_func)
+
+
+def start_task_workers() -> None:
+    for i in range(TASK_WORKERS):
+        threading.Thread(target=_task_worker, name=f"coach-task-{i}", daemon=True).start()
 
 
 def run_task_safe(task_name: str, task_func):
     """Run a task and catch exceptions."""
     try:
-        print(f"[{dt.datetime.now(TZ)}] Running task: {task_name}")
+        logger.info("Running task: %s", task_name)
         task_func()
-        print(f"[{dt.datetime.now(TZ)}] Completed: {task_name}")
-    except Exception as e:
-        print(f"[{dt.datetime.now(TZ)}] Error in {task_name}: {e}", file=sys.stderr)
+        logger.info("Completed: %s", task_name)
+    except Exception:
+        logger.exception("Error in %s", task_name)
+
+
+def next_run_time(now: dt.datetime) -> dt.datetime:
+    """Return the first whole minute after `now` at which some task is scheduled."""
+    start = _minute_of_week(now)
+    # "metrics" fires every 30 minutes, so this never scans more than 30 minutes ahead
+    ahead = 1
+    while not _FIRE[(start + ahead) % _MINUTES_PER_WEEK]:
+        ahead += 1
+    return now.replace(second=0, microsecond=0) + dt.timedelta(minutes=ahead)
 
 
 def main_loop():
-    """Main service loop - runs every minute and checks what tasks to execute."""
+    """Main service loop - sleeps until the next scheduled minute and runs what is due."""
     last_run: dict[str, dt.datetime] = {}
 
-    print(f"[{dt.datetime.now(TZ)}] Spark-Coach service started")
+    start_task_workers()
+    logger.info("Spark-Coach service started")
 
     while True:
         now = dt.datetime.now(dt.timezone.utc)
-        current_minute = now.replace(second=0, microsecond=0)
-
-        # Check each task
-        tasks = {
-            "suggest": run_morning_session,
-            "afternoon": run_afternoon_session,
-            "summary": run_summary,
-            "weekly": run_weekly_brief,
-            "scan": run_opportunity_scan,
-            "metrics": run_background_metrics,
-        }
-
-        for task_name, task_func in tasks.items():
-            if should_run_task(task_name, now):
+        fire_at = next_run_time(now)
+        time.sleep((fire_at - now).total_seconds())
+
+        mask = _FIRE[_minute_of_week(fire_at)]
+        for i, (task_name, task_func, _due) in enumerate(TASKS):
+            if mask & (1 << i):
                 # Only run once per minute
-                if last_run.get(task_name) != current_minute:
-                    last_run[task_name] = current_minute
-                    # Run in thread to not block
-                    thread = threading.Thread(
-                        target=run_task_safe, args=(task_name, task_func), daemon=True
-                    )
-                    thread.start()
+                if last_run.get(task_name) != fire_at:
+                    last_run[task_name] = fire_at
+                    # Hand off to the worker threads to not block
+                    _TASK_QUEUE.put((task_name, task_func))
 
-        # Sleep until next minute
-        time.sleep(60)
+
+def configure_logging() -> None:
+    """Timestamp log lines in CET; the time is only formatted when a record is emitted."""
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("[%(asctime)s] %(message)s")
+    formatter.converter = lambda secs: dt.datetime.fromtimestamp(secs, TZ).timetuple()
+    handler.setFormatter(formatter)
+    # Root stays at WARNING so library INFO chatter (e.g. httpx's per-request lines) is dropped
+    logging.basicConfig(level=logging.WARNING, handlers=[handler])
+    logger.setLevel(logging.INFO)
 
 
 if __name__ == "__main__":
+    configure_logging()
+
     # Start health check server in background
     health_thread = threading.Thread(target=run_health_server, daemon=True)
     health_thread.start()
-    print(f"[{dt.datetime.now(TZ)}] Health server started on :8080")
+    logger.info("Health server started on :8080")
 
     # Run main loop
     main_loop()
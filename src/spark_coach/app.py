@@ -1,8 +1,19 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from spark_coach.api.v1.slack import router as slack_router
+from spark_coach.clients.slack import close_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await close_client()
+
 
-app = FastAPI(title="spark-coach")
+app = FastAPI(title="spark-coach", lifespan=lifespan)
 
 # Routers
 app.include_router(slack_router)
@@ -2,6 +2,23 @@ import os
 
 import httpx
 
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Shared AsyncClient so webhook calls reuse pooled keep-alive connections."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=10)
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def send_webhook(
     text: str, webhook_url: str | None = None, **extra_payload: object
@@ -21,7 +38,6 @@ async def send_webhook(
     if extra_payload:
         payload.update(extra_payload)
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.post(url, json=payload)
+    resp = await get_client().post(url, json=payload)
     resp.raise_for_status()
     return {"ok": True}
@@ -1,10 +1,28 @@
 # Voice setup & weekly refresh for spark-coach
 import datetime as dt
+import functools
+import itertools
 import json
 import os
+import re
+import threading
+import time
+from typing import Any
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+from slack_sdk.socket_mode import SocketModeClient
+from slack_sdk.socket_mode.client import BaseSocketModeClient
+from slack_sdk.socket_mode.request import SocketModeRequest
+from slack_sdk.socket_mode.response import SocketModeResponse
+
+from spark_coach.storage import atomic_write
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
 
 
 def _data_dir() -> str:
@@ -15,15 +33,52 @@ def _data_dir() -> str:
     return data_dir
 
 
+@functools.lru_cache(maxsize=1)
 def _voice_path() -> str:
     return os.path.join(_data_dir(), "voice_profile.json")
 
 
+@functools.lru_cache(maxsize=1)
+def _load_profile(ino: int, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse voice_profile.json; keyed by its stat so an unchanged file is parsed only once.
+
+    Every write renames a fresh file into place, so the inode changes even when a same-size
+    rewrite lands within the filesystem's mtime granularity.
+    """
+    with open(_voice_path(), "rb") as f:
+        raw = f.read()
+    profile: dict[str, Any] = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return profile
+
+
+def _read_profile() -> dict[str, Any]:
+    """Load voice_profile.json ({} if missing or unreadable); orjson is used when installed."""
+    try:
+        st = os.stat(_voice_path())
+        # Shallow copy: callers update top-level keys before writing the profile back
+        return dict(_load_profile(st.st_ino, st.st_mtime_ns, st.st_size))
+    except Exception:
+        return {}
+
+
+def _write_profile(profile: dict[str, Any]) -> None:
+    if orjson is not None:
+        data = orjson.dumps(profile, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(profile, ensure_ascii=False, indent=2).encode()
+    atomic_write(_voice_path(), data)
+
+
+@functools.lru_cache(maxsize=1)
 def slack_client() -> WebClient:
+    """Process-wide WebClient so every post/poll reuses one keep-alive connection pool."""
     token = os.getenv("SLACK_BOT_TOKEN")
     if not token:
         raise RuntimeError("Missing SLACK_BOT_TOKEN for setup interview")
-    return WebClient(token=token)
+    client = WebClient(token=token)
+    # Polling conversations.replies can hit the Tier 3 limit; honor Retry-After
+    client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=2))
+    return client
 
 
 def slack_post(channel: str, text: str, *, thread_ts: str | None = None) -> tuple[str, str]:
@@ -35,14 +90,80 @@ def slack_post(channel: str, text: str, *, thread_ts: str | None = None) -> tupl
         raise RuntimeError(f"Slack post failed during setup: {e.response['error']}") from e
 
 
-def slack_thread_replies(channel: str, thread_ts: str, limit: int = 100) -> list[dict]:
+def slack_thread_replies(
+    channel: str, thread_ts: str, limit: int = 100, *, oldest: str | None = None
+) -> list[dict]:
+    """Thread replies oldest-first; with `oldest`, only those posted after that ts."""
     client = slack_client()
-    resp = client.conversations_replies(channel=channel, ts=thread_ts, limit=limit)
+    resp = client.conversations_replies(channel=channel, ts=thread_ts, limit=limit, oldest=oldest)
     msgs = list(resp.get("messages", []))
     # exclude parent
     return msgs[1:] if msgs and msgs[0].get("ts") == thread_ts else msgs
 
 
+# Seconds between reply polls: most answers come within the first minute or two, so polls
+# are dense early and thin out to every 30s (the last entry repeats), ~26 polls per 10 min.
+POLL_SCHEDULE = (2.0, 3.0, 4.0, 6.0, 8.0, 12.0, 16.0, 20.0, 25.0, 30.0)
+
+
+class _ThreadReplyWatcher:
+    """Wakes an interview loop when someone replies in `thread_ts`.
+
+    With SLACK_APP_TOKEN set, replies are pushed over Socket Mode and wait() returns as soon
+    as one lands, still waking every POLL_SCHEDULE[-1] seconds in case the app is not
+    subscribed to message events or one is dropped; without it wait() sleeps through
+    POLL_SCHEDULE.
+    """
+
+    def __init__(self, channel: str, thread_ts: str) -> None:
+        self._channel = channel
+        self._thread_ts = thread_ts
+        self._polls = 0
+        self._replied = threading.Event()
+        self._socket: SocketModeClient | None = None
+
+    def __enter__(self) -> "_ThreadReplyWatcher":
+        app_token = os.getenv("SLACK_APP_TOKEN")
+        if app_token:
+            # The client starts its runner threads on construction, so build it only here
+            socket = SocketModeClient(app_token=app_token, web_client=slack_client())
+            socket.socket_mode_request_listeners.append(self._on_request)
+            try:
+                socket.connect()
+            except Exception:
+                # Don't leak the runner threads; fall back to polling
+                socket.close()
+            else:
+                self._socket = socket
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._socket is not None:
+            self._socket.close()
+
+    def _on_request(self, client: BaseSocketModeClient, req: SocketModeRequest) -> None:
+        if req.type != "events_api":
+            return
+        client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
+        event = req.payload.get("event") or {}
+        if (
+            event.get("channel") == self._channel
+            and event.get("thread_ts") == self._thread_ts
+            and event.get("ts") != self._thread_ts
+        ):
+            self._replied.set()
+
+    def wait(self, timeout: float) -> None:
+        """Block until a new reply arrives (or `timeout` seconds pass)."""
+        if self._socket is None:
+            delay = POLL_SCHEDULE[min(self._polls, len(POLL_SCHEDULE) - 1)]
+            self._polls += 1
+            time.sleep(min(delay, timeout))
+            return
+        self._replied.wait(min(timeout, POLL_SCHEDULE[-1]))
+        self._replied.clear()
+
+
 QUESTIONS = [
     ("product", "Q1: What's your product in one sentence?"),
     ("recent_work", "Q2: What did you ship this week?"),
@@ -57,7 +178,50 @@ QUESTIONS = [
     ("goal", "Q8: What's your growth goal? (X followers in Y days)"),
 ]
 
-_QNUM_TO_KEY = {f"q{i}": key for i, (key, _t) in enumerate(QUESTIONS, start=1)}
+_INTERVIEW_TEXT = (
+    "[coach] Voice calibration interview (8 questions)\n"
+    "Reply to this thread with your answers. You can answer one-by-one or paste all at once using Q1:/Q2:/... prefixes.\n\n"
+    + "\n".join(q for _key, q in QUESTIONS)
+)
+
+# Answer keys in question order: "Qn" maps to _KEYS[n - 1] by index, no tuple unpacking per reply
+_KEYS = tuple(key for key, _q in QUESTIONS)
+
+_REQUIRED_KEYS = ("product", "recent_work", "contrarian_view", "style")
+# Seconds the interview keeps listening for optional answers once the required ones are in
+_OPTIONAL_GRACE = 120.0
+# A single-answer reply: "Q3: text" or "q3 text"; one anchored match yields number and answer
+_Q_RE = re.compile(rf"^q([1-{len(_KEYS)}])\s*[:\s]\s*(.*)$", re.IGNORECASE | re.DOTALL)
+# Example tweets kept from the paste; prompts only use the first few, so a huge paste is cut off
+_MAX_EXAMPLE_TWEETS = 20
+# One leading bullet marker stripped from pasted example tweets: "-"/"*" only when followed by
+# whitespace (so "*new* feature" and "-5% churn" survive), round bullets with or without it.
+# ">" is not a bullet: "> 50% of founders..." keeps its text.
+_BULLET_RE = re.compile(r"^\s*(?:[-*]\s+|[•‣●·]\s*)")
+# "Qn:" tags opening the sections of a multi-answer paste; each section runs to the next tag.
+# Matching only the tags and slicing between them avoids a lazy body + lookahead per char.
+_QN_TAG_RE = re.compile(r"(?im)^q(\d)\s*:")
+
+
+def _qn_sections(blob: str) -> list[tuple[int, str]]:
+    """Split a "Q1: ... Q2: ..." paste into (question number, answer) pairs."""
+    tags = list(_QN_TAG_RE.finditer(blob))
+    if not tags:
+        return []
+    ends = [m.start() for m in tags[1:]] + [len(blob)]
+    return [
+        (int(m.group(1)), blob[m.end() : end].strip()) for m, end in zip(tags, ends, strict=True)
+    ]
+
+
+def _answer_value(key: str, val: str) -> object:
+    """Normalise one answer: list-valued questions are split into items, others kept as text."""
+    if key == "example_tweets":
+        stripped = (_BULLET_RE.sub("", _ln, count=1).strip() for _ln in val.splitlines())
+        return list(itertools.islice(filter(None, stripped), _MAX_EXAMPLE_TWEETS))
+    if key in ("blocklist", "banned_words"):
+        return [p.strip() for p in val.replace(",", "\n").splitlines() if p.strip()]
+    return val
 
 
 def run_setup_interview(channel_env: str = "SLACK_CHANNEL_ID") -> None:
@@ -65,82 +229,53 @@ def run_setup_interview(channel_env: str = "SLACK_CHANNEL_ID") -> None:
     if not channel:
         raise RuntimeError("Missing SLACK_CHANNEL_ID for setup interview")
 
-    header = (
-        "[coach] Voice calibration interview (8 questions)\n"
-        "Reply to this thread with your answers. You can answer one-by-one or paste all at once using Q1:/Q2:/... prefixes."
-    )
-    ch, ts = slack_post(channel, header)
+    # Header and all questions go out as one message; answers are the thread's replies
+    ch, ts = slack_post(channel, _INTERVIEW_TEXT)
 
     answers: dict[str, object] = {}
-    # Post all questions once
-    for _key, q in QUESTIONS:
-        slack_post(channel, q, thread_ts=ts)
-
-    # Wait up to ~10 minutes for answers (poll every 10s)
-    import time
+    last_ts = ts
 
-    deadline = dt.datetime.now(dt.timezone.utc) + dt.timedelta(minutes=10)
+    # Wait up to ~10 minutes for answers (pushed via Socket Mode, else polled with backoff)
+    deadline = time.monotonic() + 600
 
     def _parse_block(text: str) -> None:
-        import re as _re
-
         blob = text.strip()
         if not blob:
             return
         # Parse Qn: sections if present (multi-answer paste)
-        pattern = _re.compile(r"(?im)^q(\d)\s*:\s*(.*?)(?=^q\d\s*:|\Z)", _re.DOTALL)
-        found = list(pattern.finditer(blob))
+        found = _qn_sections(blob)
         if found:
-            for m in found:
-                idx = int(m.group(1))
-                val = m.group(2).strip()
-                key = QUESTIONS[idx - 1][0] if 1 <= idx <= len(QUESTIONS) else None
-                if not key:
-                    continue
-                if key == "example_tweets":
-                    parts: list[str] = []
-                    for _ln in val.splitlines():
-                        t = _ln.lstrip().lstrip("-").lstrip("•").strip()
-                        if t:
-                            parts.append(t)
-                    answers[key] = parts
-                elif key in ("blocklist", "banned_words"):
-                    parts = [p.strip() for p in val.replace(",", "\n").splitlines() if p.strip()]
-                    answers[key] = parts
-                else:
-                    answers[key] = val
+            for idx, val in found:
+                key = _KEYS[idx - 1] if 1 <= idx <= len(_KEYS) else None
+                if key:
+                    answers[key] = _answer_value(key, val)
             return
-        # Otherwise try to detect single Qn: prefix
-        for idx, (key, _q) in enumerate(QUESTIONS, start=1):
-            tag = f"q{idx}"
-            if blob.lower().startswith(f"{tag}:") or blob.lower().startswith(f"{tag} "):
-                val = blob.split(":", 1)[1].strip() if ":" in blob else blob[len(tag) :].strip()
-                if key == "example_tweets":
-                    parts: list[str] = []
-                    for _ln in val.splitlines():
-                        t = _ln.lstrip().lstrip("-").lstrip("•").strip()
-                        if t:
-                            parts.append(t)
-                    answers[key] = parts
-                elif key in ("blocklist", "banned_words"):
-                    parts = [p.strip() for p in val.replace(",", "\n").splitlines() if p.strip()]
-                    answers[key] = parts
-                else:
-                    answers[key] = val
-                return
-
-    while dt.datetime.now(dt.timezone.utc) < deadline:
-        replies = slack_thread_replies(channel, ts, limit=200)
-        for r in replies:
-            text = (r.get("text") or "").strip()
-            if not text:
-                continue
-            _parse_block(text)
-        # Check if we have all required core fields
-        required = ["product", "recent_work", "contrarian_view", "style"]
-        if all(k in answers and answers[k] for k in required):
-            break
-        time.sleep(10)
+        # Otherwise try to detect a single "Qn:" prefix
+        m = _Q_RE.match(blob)
+        if m:
+            key = _KEYS[int(m.group(1)) - 1]
+            answers[key] = _answer_value(key, m.group(2).strip())
+
+    with _ThreadReplyWatcher(channel, ts) as watcher:
+        while True:
+            # Only replies newer than the last one parsed; earlier answers are already in `answers`
+            replies = slack_thread_replies(channel, ts, limit=200, oldest=last_ts)
+            for r in replies:
+                last_ts = max(last_ts, r.get("ts") or last_ts, key=float)
+                text = (r.get("text") or "").strip()
+                if not text or r.get("bot_id"):
+                    continue
+                _parse_block(text)
+            # Done as soon as every question is answered
+            if len(answers) == len(_KEYS):
+                break
+            # Once the core fields are in, wait only a short grace period for the optional ones
+            if all(answers.get(k) for k in _REQUIRED_KEYS):
+                deadline = min(deadline, time.monotonic() + _OPTIONAL_GRACE)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            watcher.wait(remaining)
 
     # Build profile with sensible defaults
     now = dt.datetime.now(dt.timezone.utc).date().isoformat()
@@ -169,8 +304,7 @@ def run_setup_interview(channel_env: str = "SLACK_CHANNEL_ID") -> None:
             thread_ts=ts,
         )
 
-    with open(_voice_path(), "w", encoding="utf-8") as f:
-        json.dump(profile, f, ensure_ascii=False, indent=2)
+    _write_profile(profile)
 
     # Confirmation summary
     summary_lines = [
@@ -204,31 +338,28 @@ Examples:
 - New positioning test for guilt-free giving
 """.strip(),
     )
-    import time
-
-    # Wait up to 10 minutes for a reply
-    deadline = dt.datetime.now(dt.timezone.utc) + dt.timedelta(minutes=10)
+    # Wait up to 10 minutes for a reply (pushed via Socket Mode, else polled with backoff)
+    deadline = time.monotonic() + 600
     weekly_context = None
-    while dt.datetime.now(dt.timezone.utc) < deadline:
-        replies = slack_thread_replies(channel, ts, limit=50)
-        text = "\n".join([r.get("text") or "" for r in replies]).strip()
-        if text:
-            weekly_context = text
-            break
-        time.sleep(20)
+    with _ThreadReplyWatcher(channel, ts) as watcher:
+        while True:
+            replies = slack_thread_replies(channel, ts, limit=50)
+            text = "\n".join([r.get("text") or "" for r in replies]).strip()
+            if text:
+                weekly_context = text
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            watcher.wait(remaining)
 
     # Update profile
-    try:
-        with open(_voice_path(), encoding="utf-8") as f:
-            profile = json.load(f)
-    except Exception:
-        profile = {}
+    profile = _read_profile()
     if weekly_context:
         profile["weekly_context"] = weekly_context
         profile["weekly_context_updated"] = dt.datetime.now(dt.timezone.utc).isoformat()
     profile["updated_at"] = dt.datetime.now(dt.timezone.utc).date().isoformat()
-    with open(_voice_path(), "w", encoding="utf-8") as f:
-        json.dump(profile, f, ensure_ascii=False, indent=2)
+    _write_profile(profile)
 
     slack_post(
         channel,
@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Replace `path` with `data` so readers never see a truncated file.
+
+    Each call writes its own temp file next to `path` and renames it over the target, so
+    concurrent writers never collide on a shared ".tmp" name; the last rename wins. No fsync:
+    the rename only has to be atomic, not durable.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
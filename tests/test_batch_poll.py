@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import coach
+import pytest
+
+
+class FakeBatches:
+    """Never finishes on its own; ends once cancelled, with one request already done."""
+
+    def __init__(self):
+        self.cancelled_at: float | None = None
+        self.status = "in_progress"
+
+    def create(self, requests):
+        return SimpleNamespace(id="b1", processing_status=self.status)
+
+    def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status=self.status)
+
+    def cancel(self, batch_id):
+        self.cancelled_at = clock.now
+        self.status = "ended"
+        return SimpleNamespace(id=batch_id, processing_status="canceling")
+
+    def results(self, batch_id):
+        message = SimpleNamespace(content=[SimpleNamespace(text="draft a")])
+        done = SimpleNamespace(type="succeeded", message=message)
+        return [
+            SimpleNamespace(custom_id="a", result=done),
+            SimpleNamespace(custom_id="b", result=SimpleNamespace(type="canceled")),
+        ]
+
+
+clock = SimpleNamespace(now=1000.0)
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    clock.now = 1000.0
+    fake = FakeBatches()
+    client = SimpleNamespace(messages=SimpleNamespace(batches=fake))
+    monkeypatch.setattr(coach, "_anthropic_client", lambda: client)
+    monkeypatch.setattr(coach, "_load_model_blacklist", dict)
+    monkeypatch.setattr(coach.time, "time", lambda: clock.now)
+    monkeypatch.setattr(coach.time, "sleep", lambda s: setattr(clock, "now", clock.now + s))
+    return fake
+
+
+def test_batch_is_cancelled_on_the_deadline_and_keeps_finished_results(batches):
+    out = coach._anthropic_batch_complete(
+        {"a": "p1", "b": "p2"}, task="replies", timeout_sec=90, max_poll_sec=5.0
+    )
+    assert batches.cancelled_at == 1090.0
+    assert out == {"a": "draft a"}
+
+
+def test_backoff_never_sleeps_past_the_deadline(batches):
+    coach._anthropic_batch_complete({"a": "p1"}, task="replies", timeout_sec=90)
+    assert batches.cancelled_at == 1090.0
@@ -0,0 +1,31 @@
+from coach import _extract_tweets_from_suggestions as extract
+
+
+def test_tweets_section_stops_at_reply_section():
+    s = "Tweets:\n- first\n• second\n\nReply Opportunities:\n- @someone because"
+    assert extract(s) == ["first", "second"]
+
+
+def test_tweets_section_is_capped_at_five():
+    s = "Tweets:\n" + "\n".join(f"- t{i}" for i in range(7))
+    assert extract(s) == ["t0", "t1", "t2", "t3", "t4"]
+
+
+def test_fallback_takes_first_three_bullets_anywhere():
+    s = "Here you go\n- a\n  - b\nsome prose\n• c\n- d"
+    assert extract(s) == ["a", "b", "c"]
+
+
+def test_empty_tweets_section_falls_back_to_later_bullets():
+    assert extract("Tweets:\nReply Opportunities:\n- @x why") == ["@x why"]
+
+
+def test_mixed_bullet_prefixes_are_stripped_together():
+    # Unlike the old lstrip("- ").lstrip("• ") chain, which left "• -b" as "-b"
+    assert extract("Tweets:\n• -b\n-  • c\n- - d") == ["b", "c", "d"]
+
+
+def test_bullet_only_and_non_bullet_lines_are_skipped():
+    assert extract("Tweets:\n- \n-•\nprose line\n- real\r\n") == ["real"]
+    assert extract("") == []
+    assert extract("no bullets here") == []
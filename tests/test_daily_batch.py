@@ -0,0 +1,50 @@
+import datetime as dt
+import json
+
+import coach
+import pytest
+
+
+@pytest.fixture
+def batch_file(tmp_path, monkeypatch):
+    path = tmp_path / "daily_batch.json"
+    monkeypatch.setattr(coach, "_daily_batch_path", lambda: str(path))
+    return path
+
+
+def _write_batch(path, *, date, prompt, text="Tweets:\n- hi"):
+    path.write_text(
+        json.dumps(
+            {
+                "date": date,
+                "prompt_hashes": {"suggest": coach._prompt_hash(prompt)},
+                "results": {"suggest": text},
+            }
+        )
+    )
+
+
+def _today():
+    return dt.datetime.now(dt.timezone.utc).date().isoformat()
+
+
+def test_same_day_result_is_popped_once(batch_file):
+    _write_batch(batch_file, date=_today(), prompt="p")
+    assert coach._take_daily_batch_result("suggest", "p") == "Tweets:\n- hi"
+    assert coach._take_daily_batch_result("suggest", "p") is None
+
+
+def test_prompt_hash_mismatch_is_ignored(batch_file):
+    _write_batch(batch_file, date=_today(), prompt="p")
+    assert coach._take_daily_batch_result("suggest", "other prompt") is None
+    # Left in place for a caller with the matching prompt
+    assert coach._take_daily_batch_result("suggest", "p") == "Tweets:\n- hi"
+
+
+def test_stale_date_is_ignored(batch_file):
+    _write_batch(batch_file, date="2020-01-01", prompt="p")
+    assert coach._take_daily_batch_result("suggest", "p") is None
+
+
+def test_missing_file(batch_file):
+    assert coach._take_daily_batch_result("suggest", "p") is None
@@ -0,0 +1,44 @@
+import datetime as dt
+
+import coach
+import pytest
+
+
+@pytest.fixture
+def health(monkeypatch):
+    state: dict = {}
+    history: list[dict] = []
+    monkeypatch.setattr(coach, "_load_budget_state", lambda: dict(state))
+    monkeypatch.setattr(coach, "_collect_recent_posts", lambda hours=24: [])
+    monkeypatch.setattr(coach, "_get_recent_metrics", lambda: [])
+    monkeypatch.setattr(coach, "slack_history", lambda *a, **kw: history)
+    monkeypatch.setenv("SLACK_CHANNEL_ID", "C1")
+    return state, history
+
+
+def _today():
+    return dt.datetime.now(dt.timezone.utc).date().isoformat()
+
+
+def test_counters_from_todays_state(health):
+    state, _ = health
+    state.update(date=_today(), morning_suggestions_today=1, posted_to_x_today=2)
+    report = coach.system_health_check()
+    assert "Morning: Found suggestions" in report
+    assert "Posted to X today: 2" in report
+
+
+def test_rolled_state_without_morning_post_is_missing(health):
+    state, history = health
+    state.update(coach._DAILY_STATE, date=_today())
+    history.append({"text": "**STEP 1: Pick your tweet**"})  # not consulted
+    assert "Morning: Missing" in coach.system_health_check()
+
+
+def test_stale_state_falls_back_to_history(health):
+    state, history = health
+    state.update(date="2020-01-01", morning_suggestions_today=1, posted_to_x_today=4)
+    history.append({"text": "**STEP 1: Pick your tweet**\n\n1️⃣ a"})
+    report = coach.system_health_check()
+    assert "Morning: Found suggestions" in report
+    assert "Posted to X today: 0" in report
@@ -0,0 +1,60 @@
+import time
+from types import SimpleNamespace
+
+import coach
+import pytest
+
+
+@pytest.fixture
+def cache_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(coach, "_llm_cache_path", lambda: str(tmp_path / "llm_cache.sqlite"))
+    monkeypatch.delenv("LLM_CACHE", raising=False)
+    monkeypatch.delenv("ANTHROPIC_MODEL", raising=False)
+    monkeypatch.setattr(coach, "_load_model_blacklist", dict)
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    calls: list[dict] = []
+
+    def create(**kw):
+        calls.append(kw)
+        return SimpleNamespace(content=[SimpleNamespace(text=f"reply {len(calls)}")])
+
+    client = SimpleNamespace(messages=SimpleNamespace(create=create))
+    monkeypatch.setattr(coach, "_anthropic_client", lambda: client)
+    return calls
+
+
+def test_entries_expire_after_the_task_ttl(cache_db, monkeypatch):
+    coach._llm_cache_put("k", "cached")
+    assert coach._llm_cache_get("k", "suggest") == "cached"
+    later = time.time() + coach._LLM_CACHE_TTL_SEC["suggest"] + 1
+    monkeypatch.setattr(coach.time, "time", lambda: later)
+    assert coach._llm_cache_get("k", "suggest") is None
+    # "replies" keeps entries longer than "suggest"
+    assert coach._llm_cache_get("k", "replies") == "cached"
+
+
+def test_suggest_ttl_only_covers_a_quick_retry():
+    assert coach._LLM_CACHE_TTL_SEC["suggest"] <= 10 * 60
+
+
+def test_key_depends_on_system_block():
+    base = coach._llm_cache_key("m", "system a", "prompt")
+    assert base == coach._llm_cache_key("m", "system a", "prompt")
+    assert base != coach._llm_cache_key("m", "system b", "prompt")
+    assert base != coach._llm_cache_key("m", None, "prompt")
+
+
+def test_complete_reuses_cached_text(cache_db, fake_client):
+    assert coach._anthropic_complete("p", "replies", system="s") == "reply 1"
+    assert coach._anthropic_complete("p", "replies", system="s") == "reply 1"
+    assert coach._anthropic_complete("p", "replies", system="other") == "reply 2"
+    assert len(fake_client) == 2
+
+
+def test_llm_cache_0_bypasses_the_cache(cache_db, fake_client, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE", "0")
+    assert coach._anthropic_complete("p", "replies") == "reply 1"
+    assert coach._anthropic_complete("p", "replies") == "reply 2"
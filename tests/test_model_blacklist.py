@@ -0,0 +1,32 @@
+import json
+import time
+
+import coach
+import pytest
+
+
+@pytest.fixture
+def blacklist_file(tmp_path, monkeypatch):
+    path = tmp_path / "model_blacklist.json"
+    monkeypatch.setattr(coach, "_model_blacklist_path", lambda: str(path))
+    monkeypatch.delenv("ANTHROPIC_MODEL", raising=False)
+    return path
+
+
+def test_blacklisted_model_is_skipped(blacklist_file):
+    models = coach._choose_model("suggest")
+    coach._blacklist_model(models[0])
+    assert coach._candidate_models("suggest") == models[1:]
+
+
+def test_expired_entries_are_dropped(blacklist_file):
+    models = coach._choose_model("suggest")
+    blacklist_file.write_text(json.dumps({models[0]: time.time() - 1}))
+    assert coach._load_model_blacklist() == {}
+    assert coach._candidate_models("suggest") == models
+
+
+def test_never_filters_down_to_nothing(blacklist_file):
+    models = coach._choose_model("replies")
+    blacklist_file.write_text(json.dumps({m: time.time() + 60 for m in models}))
+    assert coach._candidate_models("replies") == models
@@ -0,0 +1,33 @@
+import datetime as dt
+
+import service
+
+
+def _week_minutes():
+    monday = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+    for idx in range(service._MINUTES_PER_WEEK):
+        yield monday + dt.timedelta(minutes=idx)
+
+
+def test_fire_table_matches_task_predicates():
+    for now in _week_minutes():
+        for name, _func, due in service.TASKS:
+            assert service.should_run_task(name, now) == due(now), (name, now)
+
+
+def test_fire_table_applies_to_any_week():
+    sunday = dt.datetime(2026, 3, 15, 19, 0, tzinfo=dt.timezone.utc)
+    assert service.should_run_task("weekly", sunday)
+    assert not service.should_run_task("weekly", sunday - dt.timedelta(days=1))
+    assert not service.should_run_task("unknown", sunday)
+
+
+def test_next_run_time_is_the_next_due_minute():
+    now = dt.datetime(2026, 3, 16, 7, 29, 30, tzinfo=dt.timezone.utc)
+    assert service.next_run_time(now) == dt.datetime(2026, 3, 16, 7, 30, tzinfo=dt.timezone.utc)
+    # On a due minute itself, the next one is returned
+    at = dt.datetime(2026, 3, 16, 7, 30, tzinfo=dt.timezone.utc)
+    assert service.next_run_time(at) == dt.datetime(2026, 3, 16, 8, 0, tzinfo=dt.timezone.utc)
+    # Wraps from Sunday night into Monday
+    late = dt.datetime(2026, 3, 22, 23, 45, tzinfo=dt.timezone.utc)
+    assert service.next_run_time(late) == dt.datetime(2026, 3, 23, 0, 0, tzinfo=dt.timezone.utc)
@@ -0,0 +1,71 @@
+import time
+
+from spark_coach import setup
+from spark_coach.setup import _Q_RE, _answer_value, _qn_sections
+
+
+def test_qn_sections_splits_multi_answer_paste():
+    blob = "Q1: A budgeting app\nq2 : Shipped onboarding\nwith two lines\nQ5:\n- tweet one\n- tweet two"
+    assert _qn_sections(blob) == [
+        (1, "A budgeting app"),
+        (2, "Shipped onboarding\nwith two lines"),
+        (5, "- tweet one\n- tweet two"),
+    ]
+
+
+def test_qn_sections_ignores_tags_not_at_line_start():
+    assert _qn_sections("see q1: inline") == []
+
+
+def test_answer_value_splits_list_questions():
+    assert _answer_value("example_tweets", "- one\n\n•two\n  * three") == ["one", "two", "three"]
+    assert _answer_value("banned_words", "leverage, synergy\noptimize") == [
+        "leverage",
+        "synergy",
+        "optimize",
+    ]
+    assert _answer_value("product", "A budgeting app") == "A budgeting app"
+
+
+def test_single_answer_prefix_keeps_colons_in_the_answer():
+    assert _Q_RE.match("q3 hot take: less is more").groups() == ("3", "hot take: less is more")
+    assert _Q_RE.match("Q1:A budgeting app").groups() == ("1", "A budgeting app")
+    assert _Q_RE.match("q9: out of range") is None
+
+
+def test_example_tweet_text_keeps_markdown_and_quotes():
+    paste = "> 50% of founders skip this\n*new* feature shipped\n- - 5% churn\n-5% churn"
+    assert _answer_value("example_tweets", paste) == [
+        "> 50% of founders skip this",
+        "*new* feature shipped",
+        "- 5% churn",
+        "-5% churn",
+    ]
+
+
+def test_example_tweets_are_capped():
+    paste = "\n".join(f"- tweet {i}" for i in range(50))
+    tweets = _answer_value("example_tweets", paste)
+    assert tweets == [f"tweet {i}" for i in range(20)]
+
+
+def test_profile_round_trip_sees_rewrites(tmp_path, monkeypatch):
+    path = tmp_path / "voice_profile.json"
+    monkeypatch.setattr(setup, "_voice_path", lambda: str(path))
+    setup._load_profile.cache_clear()
+    assert setup._read_profile() == {}
+    setup._write_profile({"product": "v1"})
+    assert setup._read_profile() == {"product": "v1"}
+    setup._write_profile({"product": "v2"})
+    # Same size, possibly the same mtime tick: the new inode still invalidates the cache
+    assert setup._read_profile() == {"product": "v2"}
+    assert [p.name for p in tmp_path.iterdir()] == ["voice_profile.json"]
+
+
+def test_socket_mode_wait_still_wakes_to_poll(monkeypatch):
+    monkeypatch.setattr(setup, "POLL_SCHEDULE", (0.01,))
+    watcher = setup._ThreadReplyWatcher("C1", "1.0")
+    watcher._socket = object()  # type: ignore[assignment]  # as if connected, no events
+    started = time.monotonic()
+    watcher.wait(600)
+    assert time.monotonic() - started < 5
@@ -2,6 +2,7 @@ import respx
 from fastapi.testclient import TestClient
 
 from spark_coach.app import app
+from spark_coach.clients import slack as slack_client
 
 
 def test_slack_notify_success(monkeypatch):
@@ -23,3 +24,18 @@ def test_slack_notify_missing_webhook(monkeypatch):
 
     resp = client.post("/v1/slack/notify", json={"text": "hi"})
     assert resp.status_code == 400
+
+
+def test_slack_notify_reuses_client_and_closes_on_shutdown(monkeypatch):
+    webhook_url = "https://hooks.slack.com/services/T000/B000/XXX"
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", webhook_url)
+
+    with respx.mock(assert_all_called=True) as respx_mock:
+        route = respx_mock.post(webhook_url).respond(200, json={"ok": True})
+        with TestClient(app) as client:
+            assert client.post("/v1/slack/notify", json={"text": "one"}).status_code == 200
+            shared = slack_client._client
+            assert client.post("/v1/slack/notify", json={"text": "two"}).status_code == 200
+            assert slack_client._client is shared
+        assert route.call_count == 2
+    assert slack_client._client is None
@@ -0,0 +1,24 @@
+import threading
+
+from spark_coach.storage import atomic_write
+
+
+def test_atomic_write_concurrent_writers_do_not_collide(tmp_path):
+    path = tmp_path / "state.json"
+    errors: list[BaseException] = []
+
+    def writer(n: int) -> None:
+        try:
+            for _ in range(50):
+                atomic_write(str(path), f'{{"n": {n}}}'.encode())
+        except BaseException as e:  # pragma: no cover - failure path
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert path.read_text() in {f'{{"n": {n}}}' for n in range(8)}
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]